@@ -11,7 +11,7 @@ from typing import Dict, List, Optional, Any, Tuple
 from django.core.cache import cache
 from django.utils import timezone
 
-from apps.documents.models import Document
+from apps.documents.models import Document, _extract_rich_text
 from apps.ai_services.models import AIDocumentMetadata
 from apps.ai_services.services.ollama_client import get_ollama_client, OllamaClientError
 
@@ -145,7 +145,7 @@ class DocumentProcessor:
         
         # Extract from rich content if needed
         if isinstance(document.content, dict):
-            return document._extract_text_from_rich_content(document.content)
+            return _extract_rich_text(document.content)
         elif isinstance(document.content, str):
             return document.content
         
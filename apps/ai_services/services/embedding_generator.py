@@ -12,7 +12,7 @@ from django.core.cache import cache
 from django.db import connection
 from pgvector.django import CosineDistance
 
-from apps.documents.models import Document
+from apps.documents.models import Document, _extract_rich_text
 from apps.ai_services.models import AIDocumentMetadata
 from apps.ai_services.services.ollama_client import get_ollama_client, OllamaClientError
 
@@ -96,7 +96,7 @@ class EmbeddingGenerator:
             return document.content_text
         
         if isinstance(document.content, dict):
-            return document._extract_text_from_rich_content(document.content)
+            return _extract_rich_text(document.content)
         elif isinstance(document.content, str):
             return document.content
         
@@ -38,7 +38,8 @@ class UserAdmin(BaseUserAdmin):
         "is_active",
         "date_joined",
     )
-    list_filter = ("is_staff", "is_superuser", "is_active", "date_joined")
+    list_filter = ("is_staff", "is_superuser", "is_active")
+    date_hierarchy = "date_joined"
     search_fields = ("username", "first_name", "last_name", "email")
 
 
@@ -47,7 +48,8 @@ class UserProfileAdmin(admin.ModelAdmin):
     """Admin for user profiles."""
 
     list_display = ("user", "user_timezone", "last_active", "created_at")
-    list_filter = ("user_timezone", "created_at", "last_active")
+    list_filter = ("user_timezone",)
+    date_hierarchy = "created_at"
     search_fields = (
         "user__username",
         "user__email",
@@ -63,7 +65,8 @@ class RefreshTokenAdmin(admin.ModelAdmin):
     """Admin for refresh tokens."""
 
     list_display = ("user", "ip_address", "is_active", "expires_at", "created_at")
-    list_filter = ("is_active", "created_at", "expires_at")
+    list_filter = ("is_active",)
+    date_hierarchy = "created_at"
     search_fields = ("user__username", "user__email", "ip_address")
     readonly_fields = ("id", "token", "created_at", "last_used")
     raw_id_fields = ("user",)
@@ -77,7 +80,8 @@ class LoginAttemptAdmin(admin.ModelAdmin):
     """Admin for login attempts."""
 
     list_display = ("email", "ip_address", "success", "failure_reason", "created_at")
-    list_filter = ("success", "created_at")
+    list_filter = ("success",)
+    date_hierarchy = "created_at"
     search_fields = ("email", "ip_address")
     readonly_fields = ("id", "created_at")
 
@@ -93,7 +97,8 @@ class PasswordResetTokenAdmin(admin.ModelAdmin):
     """Admin for password reset tokens."""
 
     list_display = ("user", "is_used", "expires_at", "created_at")
-    list_filter = ("is_used", "created_at", "expires_at")
+    list_filter = ("is_used",)
+    date_hierarchy = "created_at"
     search_fields = ("user__username", "user__email")
     readonly_fields = ("id", "token", "created_at")
     raw_id_fields = ("user",)
@@ -107,7 +112,8 @@ class EmailVerificationAdmin(admin.ModelAdmin):
     """Admin for email verifications."""
 
     list_display = ("user", "email", "is_verified", "expires_at", "created_at")
-    list_filter = ("is_verified", "created_at", "expires_at")
+    list_filter = ("is_verified",)
+    date_hierarchy = "created_at"
     search_fields = ("user__username", "email")
     readonly_fields = ("id", "token", "created_at", "verified_at")
     raw_id_fields = ("user",)
@@ -17,7 +17,7 @@ from .models import (
 class CollaborationRoomAdmin(admin.ModelAdmin):
     """Admin interface for CollaborationRoom model."""
 
-    list_display = [
+    list_display = (
         "name",
         "room_type",
         "status",
@@ -27,9 +27,9 @@ class CollaborationRoomAdmin(admin.ModelAdmin):
         "max_participants",
         "created_by",
         "last_activity",
-    ]
+    )
 
-    list_filter = [
+    list_filter = (
         "room_type",
         "status",
         "is_public",
@@ -37,25 +37,25 @@ class CollaborationRoomAdmin(admin.ModelAdmin):
         "enable_video",
         "enable_cursor_tracking",
         "team",
-        "created_at",
-    ]
+    )
+    date_hierarchy = "created_at"
 
-    search_fields = [
+    search_fields = (
         "name",
         "description",
         "document__title",
         "team__name",
         "created_by__username",
-    ]
+    )
 
-    readonly_fields = [
+    readonly_fields = (
         "id",
         "active_participants_count",
         "is_full",
         "created_at",
         "updated_at",
         "last_activity",
-    ]
+    )
 
     fieldsets = (
         (
@@ -134,6 +134,12 @@ class CollaborationRoomAdmin(admin.ModelAdmin):
         ),
     )
 
+    # Changelist tuning: declarative joins, smaller pages, and no
+    # unfiltered COUNT(*) alongside the filtered one
+    list_select_related = ("document", "team", "created_by")
+    list_per_page = 50
+    show_full_result_count = False
+
     def get_queryset(self, request):
         """Optimize queryset with select_related."""
         return (
@@ -147,7 +153,7 @@ class CollaborationRoomAdmin(admin.ModelAdmin):
 class CollaborationSessionAdmin(admin.ModelAdmin):
     """Admin interface for CollaborationSession model."""
 
-    list_display = [
+    list_display = (
         "user",
         "room",
         "status",
@@ -157,24 +163,19 @@ class CollaborationSessionAdmin(admin.ModelAdmin):
         "last_seen",
         "duration_display",
         "activity_count",
-    ]
+    )
 
-    list_filter = [
-        "status",
-        "user_role",
-        "joined_at",
-        "last_seen",
-        "room__team",
-    ]
+    list_filter = ("status", "user_role", "room__team")
+    date_hierarchy = "joined_at"
 
-    search_fields = [
+    search_fields = (
         "user__username",
         "user__email",
         "room__name",
         "session_token",
-    ]
+    )
 
-    readonly_fields = [
+    readonly_fields = (
         "id",
         "session_token",
         "is_active",
@@ -185,7 +186,7 @@ class CollaborationSessionAdmin(admin.ModelAdmin):
         "left_at",
         "total_time",
         "activity_count",
-    ]
+    )
 
     fieldsets = (
         (
@@ -246,6 +247,12 @@ class CollaborationSessionAdmin(admin.ModelAdmin):
         ),
     )
 
+    # Changelist tuning: declarative joins, smaller pages, and no
+    # unfiltered COUNT(*) alongside the filtered one
+    list_select_related = ("room", "user")
+    list_per_page = 50
+    show_full_result_count = False
+
     def get_queryset(self, request):
         """Optimize queryset with select_related."""
         return super().get_queryset(request).select_related("room", "user")
@@ -266,7 +273,7 @@ class CollaborationSessionAdmin(admin.ModelAdmin):
 class CollaborationActivityAdmin(admin.ModelAdmin):
     """Admin interface for CollaborationActivity model."""
 
-    list_display = [
+    list_display = (
         "activity_type",
         "user",
         "room",
@@ -274,31 +281,26 @@ class CollaborationActivityAdmin(admin.ModelAdmin):
         "server_timestamp",
         "is_applied",
         "is_broadcast",
-    ]
+    )
 
-    list_filter = [
-        "activity_type",
-        "is_applied",
-        "is_broadcast",
-        "server_timestamp",
-        "room__team",
-    ]
+    list_filter = ("activity_type", "is_applied", "is_broadcast", "room__team")
+    date_hierarchy = "server_timestamp"
 
-    search_fields = [
+    search_fields = (
         "user__username",
         "room__name",
         "operation_id",
         "activity_type",
-    ]
+    )
 
-    readonly_fields = [
+    readonly_fields = (
         "id",
         "operation_id",
         "server_timestamp",
         "sequence_number",
         "is_applied",
         "is_broadcast",
-    ]
+    )
 
     fieldsets = (
         (
@@ -355,6 +357,12 @@ class CollaborationActivityAdmin(admin.ModelAdmin):
         ),
     )
 
+    # Changelist tuning: declarative joins, smaller pages, and no
+    # unfiltered COUNT(*) alongside the filtered one
+    list_select_related = ("room", "session", "user")
+    list_per_page = 50
+    show_full_result_count = False
+
     def get_queryset(self, request):
         """Optimize queryset with select_related."""
         return super().get_queryset(request).select_related("room", "session", "user")
@@ -364,30 +372,27 @@ class CollaborationActivityAdmin(admin.ModelAdmin):
 class CursorPositionAdmin(admin.ModelAdmin):
     """Admin interface for CursorPosition model."""
 
-    list_display = [
+    list_display = (
         "user",
         "room",
         "cursor_color_display",
         "is_visible",
         "last_updated",
-    ]
+    )
 
-    list_filter = [
-        "is_visible",
-        "last_updated",
-        "room__team",
-    ]
+    list_filter = ("is_visible", "room__team")
+    date_hierarchy = "last_updated"
 
-    search_fields = [
+    search_fields = (
         "user__username",
         "room__name",
         "user_label",
-    ]
+    )
 
-    readonly_fields = [
+    readonly_fields = (
         "id",
         "last_updated",
-    ]
+    )
 
     fieldsets = (
         (
@@ -423,6 +428,12 @@ class CursorPositionAdmin(admin.ModelAdmin):
         ("Metadata", {"fields": ("last_updated",)}),
     )
 
+    # Changelist tuning: declarative joins, smaller pages, and no
+    # unfiltered COUNT(*) alongside the filtered one
+    list_select_related = ("session", "room", "user")
+    list_per_page = 50
+    show_full_result_count = False
+
     def get_queryset(self, request):
         """Optimize queryset with select_related."""
         return super().get_queryset(request).select_related("session", "room", "user")
@@ -5,3 +5,7 @@ class CollaborationConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.collaboration"
     verbose_name = "Collaboration"
+
+    def ready(self):
+        """Import signals when the app is ready."""
+        import apps.collaboration.signals  # noqa: F401
@@ -0,0 +1,62 @@
+"""
+Versioned caching helpers for collaboration room reads.
+
+Room detail is read far more often than rooms change, so responses are
+cached under a key that embeds a per-room version counter. Invalidation
+is a cheap version bump; stale entries simply age out of Redis.
+"""
+
+from django.core.cache import cache
+
+ROOM_VERSION_KEY = "collab:room:{}:ver"
+ROOM_DETAIL_TIMEOUT = 60  # seconds
+
+USER_TEAM_IDS_KEY = "collab:user:{}:team_ids"
+USER_TEAM_IDS_TIMEOUT = 60  # seconds
+
+
+def get_user_team_ids(user_id):
+    """
+    Active team ids for a user, cached for a short TTL.
+
+    Team membership is invariant over seconds for most users, so the hot
+    list/stats endpoints read it from Redis instead of re-joining
+    team_memberships per request. Membership signals invalidate eagerly.
+    """
+    key = USER_TEAM_IDS_KEY.format(user_id)
+    team_ids = cache.get(key)
+    if team_ids is None:
+        from apps.organizations.models import TeamMembership
+
+        team_ids = list(
+            TeamMembership.objects.filter(
+                user_id=user_id, status="active"
+            ).values_list("team_id", flat=True)
+        )
+        cache.set(key, team_ids, USER_TEAM_IDS_TIMEOUT)
+    return team_ids
+
+
+def invalidate_user_team_ids(user_id):
+    """Drop the cached team id list when a membership changes."""
+    cache.delete(USER_TEAM_IDS_KEY.format(user_id))
+
+
+def get_room_version(room_id):
+    """Get the current cache version for a room (0 if never bumped)."""
+    return cache.get(ROOM_VERSION_KEY.format(room_id), 0)
+
+
+def bump_room_version(room_id):
+    """Invalidate cached room reads by advancing the room's version."""
+    key = ROOM_VERSION_KEY.format(room_id)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # Key does not exist yet; seed it past the default version
+        cache.set(key, 1, None)
+
+
+def room_detail_key(room_id, user_id):
+    """Cache key for a room detail response (user-specific: can_join)."""
+    return f"collab:room:{room_id}:v{get_room_version(room_id)}:detail:{user_id}"
@@ -5,17 +5,18 @@ WebSocket consumers for real-time collaboration.
 import json
 import logging
 
+from asgiref.sync import sync_to_async
 from channels.db import database_sync_to_async
 from channels.generic.websocket import AsyncWebsocketConsumer
 from django.utils import timezone
 from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
 from rest_framework_simplejwt.tokens import UntypedToken
 
+from .cursors import remove_cursor, update_cursor
 from .models import (
     CollaborationActivity,
     CollaborationRoom,
     CollaborationSession,
-    CursorPosition,
 )
 
 logger = logging.getLogger(__name__)
@@ -62,6 +63,7 @@ class CollaborationConsumer(AsyncWebsocketConsumer):
 
         # Broadcast user leave event
         if self.user and self.room:
+            await sync_to_async(remove_cursor)(self.room_id, self.user.id)
             await self.broadcast_user_leave()
 
     async def receive(self, text_data):
@@ -531,7 +533,7 @@ class CollaborationConsumer(AsyncWebsocketConsumer):
     @database_sync_to_async
     def record_activity(self, activity_type, activity_data):
         """Record collaboration activity."""
-        return CollaborationActivity.objects.create(
+        return CollaborationActivity.fast_insert(
             room=self.room,
             session=self.session,
             user=self.user,
@@ -541,26 +543,19 @@ class CollaborationConsumer(AsyncWebsocketConsumer):
             document_version=1,  # TODO: Get actual document version
         )
 
-    @database_sync_to_async
+    @sync_to_async
     def update_cursor_position(self, position_data, selection_data=None):
-        """Update user cursor position."""
-        cursor, created = CursorPosition.objects.get_or_create(
-            room=self.room,
-            user=self.user,
-            defaults={
-                "session": self.session,
-                "position": position_data,
-                "selection": selection_data,
-            },
+        """Update user cursor position in Redis (no database write)."""
+        user_label = (
+            self.session.session_data.get("user_label") if self.session else None
+        )
+        return update_cursor(
+            self.room_id,
+            self.user,
+            position_data,
+            selection_data,
+            user_label=user_label,
         )
-
-        if not created:
-            cursor.position = position_data
-            if selection_data:
-                cursor.selection = selection_data
-            cursor.save()
-
-        return cursor
 
     @database_sync_to_async
     def update_session_activity(self):
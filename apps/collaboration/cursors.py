@@ -0,0 +1,68 @@
+"""
+Redis-backed cursor position store for real-time collaboration.
+
+Cursor movement is the hottest event type in a collaboration room and is
+inherently ephemeral, so live cursor state is kept only in a per-room
+Redis hash instead of the cursor_positions table. The CursorPosition
+model remains for historical data but is no longer written on the
+realtime path.
+"""
+
+import json
+
+from django_redis import get_redis_connection
+
+ROOM_CURSORS_KEY = "collab:room:{}:cursors"
+CURSOR_TTL_SECONDS = 3600
+
+DEFAULT_CURSOR_COLOR = "#007bff"
+
+
+def _user_label(user):
+    """Build the display label shown next to a user's cursor."""
+    return f"{user.first_name} {user.last_name}".strip() or user.username
+
+
+def update_cursor(
+    room_id, user, position, selection=None, cursor_color=None, user_label=None
+):
+    """
+    Store a user's cursor state in the room's Redis hash.
+
+    Returns the stored cursor dict so callers can broadcast it directly
+    without re-reading Redis. Callers with a session pass its cached
+    user_label so the label isn't rebuilt per cursor move.
+    """
+    cursor = {
+        "user_id": str(user.id),
+        "username": user.username,
+        "user_label": user_label or _user_label(user),
+        "position": position,
+        "selection": selection,
+        "cursor_color": cursor_color or DEFAULT_CURSOR_COLOR,
+    }
+
+    key = ROOM_CURSORS_KEY.format(room_id)
+    redis = get_redis_connection("default")
+    pipe = redis.pipeline()
+    pipe.hset(key, str(user.id), json.dumps(cursor))
+    pipe.expire(key, CURSOR_TTL_SECONDS)
+    pipe.execute()
+
+    return cursor
+
+
+def get_room_cursors(room_id):
+    """Get all cursor states for a room as {user_id: cursor dict}."""
+    redis = get_redis_connection("default")
+    raw = redis.hgetall(ROOM_CURSORS_KEY.format(room_id))
+    return {
+        (user_id.decode() if isinstance(user_id, bytes) else user_id): json.loads(data)
+        for user_id, data in raw.items()
+    }
+
+
+def remove_cursor(room_id, user_id):
+    """Remove a user's cursor when they leave the room."""
+    redis = get_redis_connection("default")
+    redis.hdel(ROOM_CURSORS_KEY.format(room_id), str(user_id))
@@ -0,0 +1,75 @@
+from django.db import migrations
+
+# Number of hash partitions for collaboration_activities. Queries are almost
+# always scoped to a single room, so hash partitioning by room_id lets
+# Postgres prune to one partition and keeps index depth and autovacuum work
+# proportional to the hot partition rather than the full history.
+PARTITION_COUNT = 32
+
+CREATE_PARTITIONED_TABLE = (
+    [
+        "ALTER TABLE collaboration_activities RENAME TO collaboration_activities_unpartitioned;",
+        """
+        CREATE TABLE collaboration_activities (
+            LIKE collaboration_activities_unpartitioned
+            INCLUDING DEFAULTS INCLUDING CONSTRAINTS
+        ) PARTITION BY HASH (room_id);
+        """,
+        # The partition key must be part of the primary key on a
+        # partitioned table
+        "ALTER TABLE collaboration_activities ADD PRIMARY KEY (id, room_id);",
+        """
+        ALTER TABLE collaboration_activities
+            ADD CONSTRAINT collab_activity_room_fk
+            FOREIGN KEY (room_id) REFERENCES collaboration_rooms (id)
+            DEFERRABLE INITIALLY DEFERRED;
+        """,
+        """
+        ALTER TABLE collaboration_activities
+            ADD CONSTRAINT collab_activity_session_fk
+            FOREIGN KEY (session_id) REFERENCES collaboration_sessions (id)
+            DEFERRABLE INITIALLY DEFERRED;
+        """,
+        """
+        ALTER TABLE collaboration_activities
+            ADD CONSTRAINT collab_activity_user_fk
+            FOREIGN KEY (user_id) REFERENCES auth_user (id)
+            DEFERRABLE INITIALLY DEFERRED;
+        """,
+    ]
+    + [
+        f"""
+        CREATE TABLE collaboration_activities_p{i} PARTITION OF collaboration_activities
+            FOR VALUES WITH (MODULUS {PARTITION_COUNT}, REMAINDER {i});
+        """
+        for i in range(PARTITION_COUNT)
+    ]
+    + [
+        "INSERT INTO collaboration_activities SELECT * FROM collaboration_activities_unpartitioned;",
+        "DROP TABLE collaboration_activities_unpartitioned;",
+        # Recreate the model's indexes on the partitioned parent; Postgres
+        # cascades them as partition-local indexes
+        "CREATE INDEX idx_activity_room_seq ON collaboration_activities (room_id, sequence_number);",
+        "CREATE INDEX idx_activity_session ON collaboration_activities (session_id);",
+        "CREATE INDEX idx_activity_type ON collaboration_activities (activity_type);",
+        "CREATE INDEX idx_activity_timestamp ON collaboration_activities (server_timestamp);",
+        "CREATE INDEX idx_activity_operation ON collaboration_activities (operation_id);",
+        "CREATE INDEX idx_activity_applied ON collaboration_activities (is_applied);",
+        "CREATE INDEX collab_activity_user_idx ON collaboration_activities (user_id);",
+    ]
+)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("collaboration", "0001_initial"),
+    ]
+
+    operations = [
+        # Pure DDL rewrite: the Django model state is unchanged, only the
+        # physical layout of the table moves to declarative partitioning.
+        migrations.RunSQL(
+            sql=CREATE_PARTITIONED_TABLE,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.17 on 2026-08-28 02:22
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('collaboration', '0002_partition_activities_by_room'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='collaborationactivity',
+            name='idx_activity_room_seq',
+        ),
+        migrations.RemoveIndex(
+            model_name='collaborationsession',
+            name='idx_session_room_status',
+        ),
+        migrations.AddIndex(
+            model_name='collaborationactivity',
+            index=models.Index(fields=['room', '-sequence_number'], include=('server_timestamp', 'operation_id'), name='idx_act_room_seq_desc'),
+        ),
+        migrations.AddIndex(
+            model_name='collaborationsession',
+            index=models.Index(fields=['room', 'status', 'last_seen'], name='idx_sess_room_stat_seen'),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.17 on 2026-08-28 02:23
+
+import django.contrib.postgres.indexes
+from django.conf import settings
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('collaboration', '0003_remove_collaborationactivity_idx_activity_room_seq_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='collaborationactivity',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['activity_data'], name='gin_activity_data'),
+        ),
+        migrations.AddIndex(
+            model_name='collaborationactivity',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['operation'], name='gin_activity_operation'),
+        ),
+    ]
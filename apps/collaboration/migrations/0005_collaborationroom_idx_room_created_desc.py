@@ -0,0 +1,21 @@
+# Generated by Django 5.2.17 on 2026-08-28 02:35
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('collaboration', '0004_collaborationactivity_gin_activity_data_and_more'),
+        ('documents', '0003_document_draft_content_document_has_unsaved_changes_and_more'),
+        ('organizations', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='collaborationroom',
+            index=models.Index(fields=['-created_at'], name='idx_room_created_desc'),
+        ),
+    ]
@@ -13,9 +13,12 @@ import uuid
 from datetime import timedelta
 
 from django.contrib.auth.models import User
+from django.contrib.postgres.indexes import GinIndex
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models.functions import Coalesce, Now
 from django.utils import timezone
+from django_redis import get_redis_connection
 
 from apps.documents.models import Document
 from apps.organizations.models import Team
@@ -104,6 +107,8 @@ class CollaborationRoom(models.Model):
             models.Index(fields=["room_type"], name="idx_room_type"),
             models.Index(fields=["created_by"], name="idx_room_creator"),
             models.Index(fields=["last_activity"], name="idx_room_activity"),
+            # Backs keyset pagination over the room listing
+            models.Index(fields=["-created_at"], name="idx_room_created_desc"),
         ]
 
     def __str__(self):
@@ -150,16 +155,43 @@ class CollaborationRoom(models.Model):
 
         return True
 
+    def can_join_cached(self, user, memo):
+        """
+        Memoized can_join keyed by (room_id, user_id).
+
+        The memo dict lives for a single request, so repeated checks from
+        nested serializers or combined endpoints hit the DB only once.
+        """
+        key = (self.id, user.id)
+        if key not in memo:
+            memo[key] = self.can_join(user)
+        return memo[key]
+
     def get_active_sessions(self):
         """Get currently active sessions."""
-        return self.sessions.filter(
-            status="active", last_seen__gte=timezone.now() - timedelta(minutes=5)
-        ).select_related("user")
+        return CollaborationSession.active_for_serialization().filter(room=self)
 
     def update_activity(self):
-        """Update last activity timestamp."""
+        """
+        Update last activity timestamp.
+
+        Buffered in Redis and flushed to the database in batches by the
+        collaboration.flush_activity_buffers beat task, so per-keystroke
+        heartbeats never hit Postgres directly.
+        """
+        from .tasks import DIRTY_ROOMS_KEY, ROOM_BUFFER_KEY
+
         self.last_activity = timezone.now()
-        self.save(update_fields=["last_activity"])
+
+        redis = get_redis_connection("default")
+        pipe = redis.pipeline()
+        pipe.hset(
+            ROOM_BUFFER_KEY.format(self.id),
+            "last_activity",
+            self.last_activity.timestamp(),
+        )
+        pipe.sadd(DIRTY_ROOMS_KEY, str(self.id))
+        pipe.execute()
 
 
 class CollaborationSession(models.Model):
@@ -232,7 +264,12 @@ class CollaborationSession(models.Model):
         unique_together = ["room", "user"]
         ordering = ["-last_activity"]
         indexes = [
-            models.Index(fields=["room", "status"], name="idx_session_room_status"),
+            # Composite index matching the active-participants query shape
+            # (WHERE room=? AND status='active' AND last_seen>=?)
+            models.Index(
+                fields=["room", "status", "last_seen"],
+                name="idx_sess_room_stat_seen",
+            ),
             models.Index(fields=["user"], name="idx_session_user"),
             models.Index(fields=["session_token"], name="idx_session_token"),
             models.Index(fields=["status"], name="idx_session_status"),
@@ -243,13 +280,68 @@ class CollaborationSession(models.Model):
         return f"{self.user.username} in {self.room.name}"
 
     def save(self, *args, **kwargs):
-        """Override save to generate session token."""
+        """Override save to generate session token and cache the user label."""
         if not self.session_token:
             import secrets
 
             self.session_token = secrets.token_urlsafe(32)
+
+        if self._state.adding and "user_label" not in self.session_data:
+            # Computed once at session creation so cursor updates never
+            # have to rebuild (or re-fetch the user for) the label
+            self.session_data["user_label"] = (
+                f"{self.user.first_name} {self.user.last_name}".strip()
+                or self.user.username
+            )
+
         super().save(*args, **kwargs)
 
+    @classmethod
+    def active_for_serialization(cls, cutoff=None):
+        """
+        Active sessions carrying exactly the columns and annotations the
+        session serializer needs.
+
+        Shared by get_active_sessions and the viewset's Prefetch so a
+        single filtered queryset serves both the detail and sessions
+        endpoints.
+        """
+        cutoff = cutoff or (timezone.now() - timedelta(minutes=5))
+        return (
+            cls.objects.filter(status="active", last_seen__gte=cutoff)
+            .select_related("user", "room")
+            .only(
+                "id",
+                "status",
+                "user_role",
+                "session_token",
+                "joined_at",
+                "last_seen",
+                "last_activity",
+                "left_at",
+                "total_time",
+                "activity_count",
+                "room__name",
+                "user__id",
+                "user__username",
+                "user__first_name",
+                "user__last_name",
+                "user__email",
+            )
+            .annotate(
+                # Computed in the database so serializers don't evaluate
+                # the Python properties (and timezone.now()) per row
+                db_is_active=models.ExpressionWrapper(
+                    models.Q(status="active") & models.Q(last_seen__gte=cutoff),
+                    output_field=models.BooleanField(),
+                ),
+                db_duration=models.ExpressionWrapper(
+                    Coalesce("left_at", Now()) - models.F("joined_at"),
+                    output_field=models.DurationField(),
+                ),
+            )
+        )
+
     @property
     def is_active(self):
         """Check if session is currently active."""
@@ -267,22 +359,43 @@ class CollaborationSession(models.Model):
         return timezone.now() - self.joined_at
 
     def update_activity(self, activity_type=None):
-        """Update session activity."""
+        """
+        Update session activity.
+
+        Writes only to Redis; the collaboration.flush_activity_buffers beat
+        task batches buffered sessions into a single bulk_update every few
+        seconds. At editor cadence this coalesces dozens of per-event
+        UPDATEs into one row write per flush interval.
+        """
+        from .tasks import (
+            DIRTY_ROOMS_KEY,
+            DIRTY_SESSIONS_KEY,
+            ROOM_BUFFER_KEY,
+            SESSION_BUFFER_KEY,
+        )
+
         now = timezone.now()
         self.last_seen = now
         self.last_activity = now
         self.activity_count += 1
 
-        # Update total time
-        if self.status == "active":
-            self.total_time = self.duration
-
-        self.save(
-            update_fields=["last_seen", "last_activity", "activity_count", "total_time"]
+        redis = get_redis_connection("default")
+        session_key = SESSION_BUFFER_KEY.format(self.id)
+        pipe = redis.pipeline()
+        pipe.hset(
+            session_key,
+            mapping={
+                "last_seen": now.timestamp(),
+                "last_activity": now.timestamp(),
+            },
         )
+        pipe.hincrby(session_key, "activity_count", 1)
+        pipe.sadd(DIRTY_SESSIONS_KEY, str(self.id))
 
-        # Update room activity
-        self.room.update_activity()
+        # Buffer room activity too (avoids loading the room row here)
+        pipe.hset(ROOM_BUFFER_KEY.format(self.room_id), "last_activity", now.timestamp())
+        pipe.sadd(DIRTY_ROOMS_KEY, str(self.room_id))
+        pipe.execute()
 
     def disconnect(self):
         """Mark session as disconnected."""
@@ -370,14 +483,22 @@ class CollaborationActivity(models.Model):
         db_table = "collaboration_activities"
         ordering = ["sequence_number", "server_timestamp"]
         indexes = [
+            # Covering index for the per-room replay/latest-sequence scans;
+            # INCLUDE keeps them index-only without widening the key
             models.Index(
-                fields=["room", "sequence_number"], name="idx_activity_room_seq"
+                fields=["room", "-sequence_number"],
+                include=["server_timestamp", "operation_id"],
+                name="idx_act_room_seq_desc",
             ),
             models.Index(fields=["session"], name="idx_activity_session"),
             models.Index(fields=["activity_type"], name="idx_activity_type"),
             models.Index(fields=["server_timestamp"], name="idx_activity_timestamp"),
             models.Index(fields=["operation_id"], name="idx_activity_operation"),
             models.Index(fields=["is_applied"], name="idx_activity_applied"),
+            # GIN indexes so JSONB containment/key filters on the hot
+            # activity table use index lookups instead of sequential scans
+            GinIndex(fields=["activity_data"], name="gin_activity_data"),
+            GinIndex(fields=["operation"], name="gin_activity_operation"),
         ]
 
     def __str__(self):
@@ -385,15 +506,14 @@ class CollaborationActivity(models.Model):
 
     def save(self, *args, **kwargs):
         """Override save to set sequence number and operation ID."""
+        self._fill_generated_fields()
+        super().save(*args, **kwargs)
+
+    def _fill_generated_fields(self):
+        """Populate sequence_number and operation_id if unset."""
         if not self.sequence_number:
-            # Get next sequence number for this room
-            last_activity = (
-                CollaborationActivity.objects.filter(room=self.room)
-                .order_by("-sequence_number")
-                .first()
-            )
-            self.sequence_number = (
-                (last_activity.sequence_number + 1) if last_activity else 1
+            self.sequence_number = CollaborationActivity.next_sequence_number(
+                self.room_id
             )
 
         if not self.operation_id and self.operation:
@@ -401,7 +521,32 @@ class CollaborationActivity(models.Model):
 
             self.operation_id = secrets.token_urlsafe(16)
 
-        super().save(*args, **kwargs)
+    @classmethod
+    def next_sequence_number(cls, room_id):
+        """Allocate the next per-room sequence number from a Redis counter."""
+        redis = get_redis_connection("default")
+        key = f"collab:room:{room_id}:seq"
+        sequence = redis.incr(key)
+        if sequence == 1:
+            # Counter was empty (first activity or Redis flush); seed it
+            # from the database high-water mark
+            last = cls.objects.filter(room_id=room_id).aggregate(
+                max_seq=models.Max("sequence_number")
+            )["max_seq"]
+            if last:
+                sequence = redis.incrby(key, last)
+        return sequence
+
+    @classmethod
+    def fast_insert(cls, **kwargs):
+        """
+        Insert an activity via bulk_create, skipping the default save()
+        existence check and signal dispatch on the realtime hot path.
+        """
+        activity = cls(**kwargs)
+        activity._fill_generated_fields()
+        cls.objects.bulk_create([activity])
+        return activity
 
 
 class CursorPosition(models.Model):
@@ -452,12 +597,3 @@ class CursorPosition(models.Model):
 
     def __str__(self):
         return f"{self.user.username} cursor in {self.room.name}"
-
-    def save(self, *args, **kwargs):
-        """Override save to set user label."""
-        if not self.user_label:
-            self.user_label = (
-                f"{self.user.first_name} {self.user.last_name}".strip()
-                or self.user.username
-            )
-        super().save(*args, **kwargs)
@@ -4,9 +4,10 @@ Serializers for collaboration app.
 
 from django.contrib.auth.models import User
 from django.db import transaction
+from django.db.models import Exists, OuterRef
 from rest_framework import serializers
 
-from apps.documents.models import Document
+from apps.documents.models import Document, DocumentPermission
 
 from .models import (
     CollaborationActivity,
@@ -16,6 +17,15 @@ from .models import (
 )
 
 
+def can_join_memoized(room, request):
+    """Check room.can_join through a per-request (room_id, user_id) memo."""
+    memo = getattr(request, "_can_join_memo", None)
+    if memo is None:
+        memo = {}
+        request._can_join_memo = memo
+    return room.can_join_cached(request.user, memo)
+
+
 class UserBasicSerializer(serializers.ModelSerializer):
     """Basic user information for collaboration contexts."""
 
@@ -57,9 +67,12 @@ class CollaborationRoomListSerializer(serializers.ModelSerializer):
         ]
 
     def get_user_can_join(self, obj):
-        """Check if current user can join this room."""
-        user = self.context["request"].user
-        return obj.can_join(user)
+        """Look up the joinable flag precomputed by the view."""
+        joinable = self.context.get("joinable")
+        if joinable is not None:
+            return joinable.get(obj.id, False)
+        # No precomputed context available; fall back to the memoized check
+        return can_join_memoized(obj, self.context["request"])
 
 
 class CollaborationRoomDetailSerializer(serializers.ModelSerializer):
@@ -68,8 +81,8 @@ class CollaborationRoomDetailSerializer(serializers.ModelSerializer):
     created_by = UserBasicSerializer(read_only=True)
     document_title = serializers.CharField(source="document.title", read_only=True)
     team_name = serializers.CharField(source="team.name", read_only=True)
-    active_participants_count = serializers.IntegerField(read_only=True)
-    is_full = serializers.BooleanField(read_only=True)
+    active_participants_count = serializers.SerializerMethodField()
+    is_full = serializers.SerializerMethodField()
     user_can_join = serializers.SerializerMethodField()
     active_sessions = serializers.SerializerMethodField()
 
@@ -102,14 +115,28 @@ class CollaborationRoomDetailSerializer(serializers.ModelSerializer):
             "last_activity",
         ]
 
+    def get_active_participants_count(self, obj):
+        """Prefer the view's active_session_count annotation over the property."""
+        annotated = getattr(obj, "active_session_count", None)
+        return annotated if annotated is not None else obj.active_participants_count
+
+    def get_is_full(self, obj):
+        """Derive fullness from the annotated count when available."""
+        return self.get_active_participants_count(obj) >= obj.max_participants
+
     def get_user_can_join(self, obj):
-        """Check if current user can join this room."""
-        user = self.context["request"].user
-        return obj.can_join(user)
+        """Look up the joinable flag precomputed by the view, if any."""
+        joinable = self.context.get("joinable")
+        if joinable is not None:
+            return joinable.get(obj.id, False)
+        return can_join_memoized(obj, self.context["request"])
 
     def get_active_sessions(self, obj):
         """Get active sessions in this room."""
-        active_sessions = obj.get_active_sessions()
+        # Served from the viewset's filtered Prefetch when available
+        active_sessions = getattr(obj, "active_sessions_list", None)
+        if active_sessions is None:
+            active_sessions = obj.get_active_sessions()
         return CollaborationSessionSerializer(active_sessions, many=True).data
 
 
@@ -138,23 +165,39 @@ class CollaborationRoomCreateSerializer(serializers.ModelSerializer):
 
     def validate_document_id(self, value):
         """Validate that document exists and user has access."""
+        user = self.context["request"].user
         try:
-            document = Document.objects.get(id=value)
+            # Single query: the write check rides along as an EXISTS
+            # annotation instead of separate permission lookups
+            document = (
+                Document.objects.select_related("team")
+                .annotate(
+                    user_can_write=Exists(
+                        DocumentPermission.objects.filter(
+                            document=OuterRef("pk"),
+                            user=user,
+                            permission_level__in=["write", "admin"],
+                        )
+                    )
+                )
+                .get(id=value)
+            )
         except Document.DoesNotExist:
             raise serializers.ValidationError("Document does not exist")
 
-        user = self.context["request"].user
-        if not document.can_write(user):
+        if not document.user_can_write:
             raise serializers.ValidationError(
                 "You don't have permission to create rooms for this document"
             )
 
+        # Stash the loaded document so create() doesn't re-fetch it
+        self.context["document"] = document
         return value
 
     def create(self, validated_data):
         """Create collaboration room."""
-        document_id = validated_data.pop("document_id")
-        document = Document.objects.get(id=document_id)
+        validated_data.pop("document_id")
+        document = self.context["document"]
         user = self.context["request"].user
 
         with transaction.atomic():
@@ -208,17 +251,15 @@ class CollaborationRoomUpdateSerializer(serializers.ModelSerializer):
 class CollaborationSessionSerializer(serializers.ModelSerializer):
     """Serializer for collaboration sessions."""
 
-    user = UserBasicSerializer(read_only=True)
     room_name = serializers.CharField(source="room.name", read_only=True)
-    is_active = serializers.BooleanField(read_only=True)
-    duration = serializers.DurationField(read_only=True)
+    is_active = serializers.SerializerMethodField()
+    duration = serializers.SerializerMethodField()
 
     class Meta:
         model = CollaborationSession
         fields = [
             "id",
             "room_name",
-            "user",
             "session_token",
             "status",
             "user_role",
@@ -242,6 +283,29 @@ class CollaborationSessionSerializer(serializers.ModelSerializer):
             "activity_count",
         ]
 
+    def get_is_active(self, obj):
+        """Prefer the db_is_active annotation over the Python property."""
+        annotated = getattr(obj, "db_is_active", None)
+        return annotated if annotated is not None else obj.is_active
+
+    def get_duration(self, obj):
+        """Prefer the db_duration annotation over the Python property."""
+        duration = getattr(obj, "db_duration", None) or obj.duration
+        return serializers.DurationField().to_representation(duration)
+
+    def to_representation(self, instance):
+        """Inline the user dict instead of a per-row nested serializer."""
+        data = super().to_representation(instance)
+        user = instance.user
+        data["user"] = {
+            "id": user.id,
+            "username": user.username,
+            "first_name": user.first_name,
+            "last_name": user.last_name,
+            "email": user.email,
+        }
+        return data
+
 
 class CollaborationActivitySerializer(serializers.ModelSerializer):
     """Serializer for collaboration activities."""
@@ -330,7 +394,7 @@ class JoinRoomSerializer(serializers.Serializer):
         if not room:
             raise serializers.ValidationError("Room not found")
 
-        if not room.can_join(user):
+        if not can_join_memoized(room, self.context["request"]):
             raise serializers.ValidationError("Cannot join this room")
 
         return data
@@ -344,12 +408,13 @@ class WebSocketTokenSerializer(serializers.Serializer):
     def validate_room_id(self, value):
         """Validate that room exists and user has access."""
         try:
-            room = CollaborationRoom.objects.get(id=value)
+            room = CollaborationRoom.objects.select_related(
+                "document", "team"
+            ).get(id=value)
         except CollaborationRoom.DoesNotExist:
             raise serializers.ValidationError("Room does not exist")
 
-        user = self.context["request"].user
-        if not room.can_join(user):
+        if not can_join_memoized(room, self.context["request"]):
             raise serializers.ValidationError("Cannot access this room")
 
         return value
@@ -0,0 +1,35 @@
+"""
+Signals for collaboration app.
+
+Keeps the per-room cache version in sync so cached room detail responses
+are invalidated whenever a room or one of its sessions changes.
+"""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.organizations.models import TeamMembership
+
+from .cache import bump_room_version, invalidate_user_team_ids
+from .models import CollaborationRoom, CollaborationSession
+
+
+@receiver(post_save, sender=CollaborationRoom)
+@receiver(post_delete, sender=CollaborationRoom)
+def invalidate_room_cache(sender, instance, **kwargs):
+    """Bump the room cache version when the room itself changes."""
+    bump_room_version(instance.id)
+
+
+@receiver(post_save, sender=CollaborationSession)
+@receiver(post_delete, sender=CollaborationSession)
+def invalidate_room_cache_on_session_change(sender, instance, **kwargs):
+    """Bump the room cache version when session membership changes."""
+    bump_room_version(instance.room_id)
+
+
+@receiver(post_save, sender=TeamMembership)
+@receiver(post_delete, sender=TeamMembership)
+def invalidate_team_ids_on_membership_change(sender, instance, **kwargs):
+    """Drop the user's cached team id list when their membership changes."""
+    invalidate_user_team_ids(instance.user_id)
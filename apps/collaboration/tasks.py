@@ -0,0 +1,119 @@
+"""
+Celery tasks for collaboration app.
+
+Flushes Redis-buffered session/room activity to the database in batches so
+that high-frequency heartbeats and keystrokes never write to Postgres
+directly.
+"""
+
+import logging
+from datetime import datetime, timezone as dt_timezone
+from typing import Any, Dict
+
+from celery import shared_task
+from django_redis import get_redis_connection
+
+logger = logging.getLogger(__name__)
+
+# Redis key layout for buffered activity
+SESSION_BUFFER_KEY = "collab:session:{}"
+ROOM_BUFFER_KEY = "collab:room:{}"
+DIRTY_SESSIONS_KEY = "collab:dirty_sessions"
+DIRTY_ROOMS_KEY = "collab:dirty_rooms"
+
+
+def _decode(value):
+    """Decode a Redis bytes value to str."""
+    return value.decode() if isinstance(value, bytes) else value
+
+
+def _to_datetime(timestamp):
+    """Convert a buffered UNIX timestamp back to an aware datetime."""
+    return datetime.fromtimestamp(float(timestamp), tz=dt_timezone.utc)
+
+
+@shared_task(name="collaboration.flush_activity_buffers")
+def flush_activity_buffers() -> Dict[str, Any]:
+    """
+    Flush buffered session and room activity from Redis to the database.
+
+    Runs on a short Celery beat interval. All buffered sessions/rooms are
+    read in one pipelined round trip and persisted with a single
+    bulk_update per model, collapsing per-event UPDATEs into one write
+    every flush interval.
+    """
+    from apps.collaboration.models import CollaborationRoom, CollaborationSession
+
+    redis = get_redis_connection("default")
+
+    session_ids = [_decode(sid) for sid in redis.smembers(DIRTY_SESSIONS_KEY)]
+    room_ids = [_decode(rid) for rid in redis.smembers(DIRTY_ROOMS_KEY)]
+
+    sessions_flushed = 0
+    rooms_flushed = 0
+
+    if session_ids:
+        pipe = redis.pipeline()
+        for session_id in session_ids:
+            pipe.hgetall(SESSION_BUFFER_KEY.format(session_id))
+        buffered = dict(zip(session_ids, pipe.execute()))
+
+        sessions = list(CollaborationSession.objects.filter(id__in=session_ids))
+        for session in sessions:
+            data = {
+                _decode(key): _decode(value)
+                for key, value in buffered.get(str(session.id), {}).items()
+            }
+            if not data:
+                continue
+
+            if "last_seen" in data:
+                session.last_seen = _to_datetime(data["last_seen"])
+            if "last_activity" in data:
+                session.last_activity = _to_datetime(data["last_activity"])
+            session.activity_count += int(data.get("activity_count", 0))
+            if session.status == "active":
+                session.total_time = session.last_activity - session.joined_at
+
+        CollaborationSession.objects.bulk_update(
+            sessions,
+            ["last_seen", "last_activity", "activity_count", "total_time"],
+        )
+        sessions_flushed = len(sessions)
+
+        # Clear buffers only after the database write succeeded
+        pipe = redis.pipeline()
+        for session_id in session_ids:
+            pipe.delete(SESSION_BUFFER_KEY.format(session_id))
+        pipe.srem(DIRTY_SESSIONS_KEY, *session_ids)
+        pipe.execute()
+
+    if room_ids:
+        pipe = redis.pipeline()
+        for room_id in room_ids:
+            pipe.hget(ROOM_BUFFER_KEY.format(room_id), "last_activity")
+        buffered = dict(zip(room_ids, pipe.execute()))
+
+        rooms = list(CollaborationRoom.objects.filter(id__in=room_ids))
+        for room in rooms:
+            timestamp = buffered.get(str(room.id))
+            if timestamp:
+                room.last_activity = _to_datetime(_decode(timestamp))
+
+        CollaborationRoom.objects.bulk_update(rooms, ["last_activity"])
+        rooms_flushed = len(rooms)
+
+        pipe = redis.pipeline()
+        for room_id in room_ids:
+            pipe.delete(ROOM_BUFFER_KEY.format(room_id))
+        pipe.srem(DIRTY_ROOMS_KEY, *room_ids)
+        pipe.execute()
+
+    if sessions_flushed or rooms_flushed:
+        logger.debug(
+            "Flushed activity buffers: %s sessions, %s rooms",
+            sessions_flushed,
+            rooms_flushed,
+        )
+
+    return {"sessions_flushed": sessions_flushed, "rooms_flushed": rooms_flushed}
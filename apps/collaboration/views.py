@@ -4,18 +4,23 @@ API views for collaboration app.
 
 from datetime import timedelta
 
+from django.core.cache import cache
+from django.db.models import Count, Prefetch, Q
 from django.utils import timezone
 from drf_spectacular.utils import extend_schema, extend_schema_view
 from rest_framework import generics
 from rest_framework import permissions as drf_permissions
 from rest_framework import status
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import CursorPagination
 from rest_framework.response import Response
 from rest_framework.viewsets import ModelViewSet
-from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.tokens import AccessToken
 
-from apps.organizations.models import Team
+from apps.documents.models import DocumentPermission
 
+from .cache import ROOM_DETAIL_TIMEOUT, get_user_team_ids, room_detail_key
 from .models import CollaborationActivity, CollaborationRoom, CollaborationSession
 from .serializers import (
     CollaborationRoomCreateSerializer,
@@ -29,6 +34,19 @@ from .serializers import (
 )
 
 
+class RoomCursorPagination(CursorPagination):
+    """
+    Keyset pagination for room listings.
+
+    Unlike page-number pagination, deep pages stay O(page_size): Postgres
+    seeks into the created_at index instead of scanning and discarding
+    OFFSET rows.
+    """
+
+    ordering = "-created_at"
+    page_size = 25
+
+
 @extend_schema_view(
     list=extend_schema(
         summary="List collaboration rooms",
@@ -55,6 +73,7 @@ class CollaborationRoomViewSet(ModelViewSet):
     """ViewSet for collaboration room management."""
 
     lookup_field = "id"
+    pagination_class = RoomCursorPagination
 
     def get_queryset(self):
         """Get collaboration rooms accessible to the user."""
@@ -62,20 +81,67 @@ class CollaborationRoomViewSet(ModelViewSet):
         if not user.is_authenticated:
             return CollaborationRoom.objects.none()
 
-        # Get user's teams
-        user_teams = Team.objects.filter(
-            memberships__user=user, memberships__status="active"
-        )
-
         # Get rooms from user's teams
-        queryset = CollaborationRoom.objects.filter(team__in=user_teams)
+        queryset = self._user_rooms_queryset(user)
 
         # Apply filters
         queryset = self._apply_filters(queryset)
 
-        return queryset.select_related(
-            "document", "team", "created_by"
-        ).prefetch_related("sessions", "activities")
+        # The list action projects its own columns via values(); for the
+        # model-instance actions, defer the wide document TEXT/JSON columns
+        # that no room serializer touches
+        queryset = queryset.select_related("document", "team", "created_by").defer(
+            "document__content",
+            "document__draft_content",
+            "document__content_text",
+            "document__editor_settings",
+            "document__metadata",
+            "document__tags",
+        )
+
+        # Only the detail/sessions views render session collections; the
+        # list projection would materialize thousands of unused child rows
+        if self.action in ("retrieve", "sessions"):
+            queryset = queryset.prefetch_related(
+                Prefetch(
+                    "sessions",
+                    queryset=CollaborationSession.active_for_serialization(),
+                    to_attr="active_sessions_list",
+                )
+            )
+        if self.action == "retrieve":
+            # Count active sessions in the same scan instead of shipping
+            # session rows to Python through the property; the activities
+            # relation is never rendered by the detail serializer, so it
+            # is no longer prefetched at all
+            cutoff = timezone.now() - timedelta(minutes=5)
+            queryset = queryset.annotate(
+                active_session_count=Count(
+                    "sessions",
+                    filter=Q(
+                        sessions__status="active", sessions__last_seen__gte=cutoff
+                    ),
+                    distinct=True,
+                )
+            )
+
+        return queryset
+
+    @staticmethod
+    def _user_rooms_queryset(user):
+        """
+        Rooms belonging to the user's active teams.
+
+        Filters on the Redis-cached team id list, so the common path hits
+        collaboration_rooms alone with a concrete IN list instead of
+        joining team_memberships per request.
+        """
+        team_ids = get_user_team_ids(user.id)
+        if not team_ids:
+            # Memberless users (onboarding, API probing) get an empty
+            # queryset without touching the database at all
+            return CollaborationRoom.objects.none()
+        return CollaborationRoom.objects.filter(team_id__in=team_ids)
 
     def _apply_filters(self, queryset):
         """Apply query parameter filters."""
@@ -94,23 +160,171 @@ class CollaborationRoomViewSet(ModelViewSet):
         if room_status:
             queryset = queryset.filter(status=room_status)
 
-        # Filter by public/private
+        # Filter by public/private (validated once, coerced outside the ORM)
         is_public = self.request.query_params.get("public")
         if is_public is not None:
-            queryset = queryset.filter(is_public=is_public.lower() == "true")
+            value = is_public.lower()
+            if value in ("true", "1", "yes"):
+                queryset = queryset.filter(is_public=True)
+            elif value in ("false", "0", "no"):
+                queryset = queryset.filter(is_public=False)
+            else:
+                raise ValidationError(
+                    {"public": "Must be a boolean value (true/false)."}
+                )
 
         return queryset
 
+    # Projection for the list endpoint; everything the UI renders plus the
+    # fields needed to compute user_can_join in bulk
+    LIST_VALUES_FIELDS = (
+        "id",
+        "name",
+        "description",
+        "room_type",
+        "status",
+        "document_id",
+        "document__title",
+        "document__is_public",
+        "team_id",
+        "team__name",
+        "is_public",
+        "max_participants",
+        "allow_anonymous",
+        "enable_voice",
+        "enable_video",
+        "enable_cursor_tracking",
+        "created_by__id",
+        "created_by__username",
+        "created_by__first_name",
+        "created_by__last_name",
+        "created_by__email",
+        "created_at",
+        "last_activity",
+    )
+
+    def list(self, request, *args, **kwargs):
+        """
+        List rooms via a values() projection.
+
+        Bypasses model instantiation and the serializer field loop for the
+        sidebar-style listing; the ModelSerializers remain in use for
+        detail/create/update.
+        """
+        cutoff = timezone.now() - timedelta(minutes=5)
+        queryset = (
+            self.filter_queryset(self.get_queryset())
+            .annotate(
+                active_participants_count=Count(
+                    "sessions",
+                    filter=Q(
+                        sessions__status="active", sessions__last_seen__gte=cutoff
+                    ),
+                )
+            )
+            .values(*self.LIST_VALUES_FIELDS, "active_participants_count")
+        )
+
+        page = self.paginate_queryset(queryset)
+        rows = page if page is not None else list(queryset)
+
+        joinable = self._build_joinable_map(request.user, rows)
+        data = [self._room_row_to_dict(row, joinable) for row in rows]
+
+        if page is not None:
+            return self.get_paginated_response(data)
+        return Response(data)
+
+    def _build_joinable_map(self, user, rows):
+        """
+        Precompute a {room_id: bool} joinable map for the listed rows,
+        replacing per-room subqueries with two queries for the whole page.
+        """
+        user_team_ids = set(get_user_team_ids(user.id))
+
+        document_ids = {row["document_id"] for row in rows}
+        readable_document_ids = set(
+            DocumentPermission.objects.filter(
+                user=user,
+                document_id__in=document_ids,
+                permission_level__in=["read", "write", "admin"],
+            ).values_list("document_id", flat=True)
+        )
+
+        # Team-level read access for public documents (already projected,
+        # so this adds no extra queries)
+        for row in rows:
+            if row["document__is_public"] and row["team_id"] in user_team_ids:
+                readable_document_ids.add(row["document_id"])
+
+        return {
+            row["id"]: (
+                row["status"] == "active"
+                and row["active_participants_count"] < row["max_participants"]
+                and (row["allow_anonymous"] or row["team_id"] in user_team_ids)
+                and row["document_id"] in readable_document_ids
+            )
+            for row in rows
+        }
+
+    @staticmethod
+    def _room_row_to_dict(row, joinable):
+        """Shape a values() row like the list serializer output."""
+        return {
+            "id": row["id"],
+            "name": row["name"],
+            "description": row["description"],
+            "room_type": row["room_type"],
+            "status": row["status"],
+            "document_title": row["document__title"],
+            "team_name": row["team__name"],
+            "is_public": row["is_public"],
+            "max_participants": row["max_participants"],
+            "active_participants_count": row["active_participants_count"],
+            "enable_voice": row["enable_voice"],
+            "enable_video": row["enable_video"],
+            "enable_cursor_tracking": row["enable_cursor_tracking"],
+            "created_by": {
+                "id": row["created_by__id"],
+                "username": row["created_by__username"],
+                "first_name": row["created_by__first_name"],
+                "last_name": row["created_by__last_name"],
+                "email": row["created_by__email"],
+            },
+            "user_can_join": joinable.get(row["id"], False),
+            "created_at": row["created_at"],
+            "last_activity": row["last_activity"],
+        }
+
+    def retrieve(self, request, *args, **kwargs):
+        """
+        Serve room detail from a per-room versioned cache.
+
+        Keys embed the room's cache version (bumped by room/session
+        signals) and the requesting user, so hot detail reads are served
+        from Redis and the DB only sees writes and cache misses.
+        """
+        key = room_detail_key(kwargs[self.lookup_field], request.user.id)
+        data = cache.get(key)
+        if data is None:
+            room = self.get_object()
+            data = self.get_serializer(room).data
+            cache.set(key, data, ROOM_DETAIL_TIMEOUT)
+        return Response(data)
+
+    # Action → serializer class; anything unlisted gets the detail view
+    serializer_classes = {
+        "list": CollaborationRoomListSerializer,
+        "create": CollaborationRoomCreateSerializer,
+        "update": CollaborationRoomUpdateSerializer,
+        "partial_update": CollaborationRoomUpdateSerializer,
+    }
+
     def get_serializer_class(self):
         """Return appropriate serializer class."""
-        if self.action == "list":
-            return CollaborationRoomListSerializer
-        elif self.action == "create":
-            return CollaborationRoomCreateSerializer
-        elif self.action in ["update", "partial_update"]:
-            return CollaborationRoomUpdateSerializer
-        else:
-            return CollaborationRoomDetailSerializer
+        return self.serializer_classes.get(
+            self.action, CollaborationRoomDetailSerializer
+        )
 
     def create(self, request, *args, **kwargs):
         """Create a collaboration room and return detailed response."""
@@ -137,11 +351,18 @@ class CollaborationRoomViewSet(ModelViewSet):
         )
         serializer.is_valid(raise_exception=True)
 
-        # Create or get session
-        session, created = CollaborationSession.objects.get_or_create(
+        # Upsert the session on (room, user): one call covers both the
+        # first join and a rejoin, instead of get_or_create followed by a
+        # separate save() on the rejoin path
+        session, created = CollaborationSession.objects.update_or_create(
             room=room,
             user=request.user,
             defaults={
+                "status": "active",
+                "user_role": serializer.validated_data["user_role"],
+                "last_seen": timezone.now(),
+            },
+            create_defaults={
                 "user_role": serializer.validated_data["user_role"],
                 "client_info": serializer.validated_data.get("client_info", {}),
                 "ip_address": request.META.get("REMOTE_ADDR"),
@@ -149,13 +370,6 @@ class CollaborationRoomViewSet(ModelViewSet):
             },
         )
 
-        if not created:
-            # Update existing session
-            session.status = "active"
-            session.user_role = serializer.validated_data["user_role"]
-            session.last_seen = timezone.now()
-            session.save()
-
         return Response(
             {
                 "message": "Successfully joined room",
@@ -168,7 +382,9 @@ class CollaborationRoomViewSet(ModelViewSet):
     def sessions(self, request, id=None):
         """Get active sessions in the room."""
         room = self.get_object()
-        active_sessions = room.get_active_sessions()
+        active_sessions = getattr(room, "active_sessions_list", None)
+        if active_sessions is None:
+            active_sessions = room.get_active_sessions()
 
         serializer = CollaborationSessionSerializer(active_sessions, many=True)
         return Response(serializer.data)
@@ -181,27 +397,42 @@ class CollaborationRoomViewSet(ModelViewSet):
     def stats(self, request):
         """Get collaboration statistics for user's teams."""
         user = request.user
-        user_teams = Team.objects.filter(
-            memberships__user=user, memberships__status="active"
-        )
 
-        # Base queryset
-        rooms = CollaborationRoom.objects.filter(team__in=user_teams)
-        sessions = CollaborationSession.objects.filter(room__in=rooms)
-        activities = CollaborationActivity.objects.filter(room__in=rooms)
+        # The cached team id list gives the three aggregates below a
+        # concrete IN list without re-resolving membership per table
+        team_ids = get_user_team_ids(user.id)
+        rooms = CollaborationRoom.objects.filter(team_id__in=team_ids)
+        sessions = CollaborationSession.objects.filter(room__team_id__in=team_ids)
+        activities = CollaborationActivity.objects.filter(room__team_id__in=team_ids)
+
+        # Conditional aggregation: one query per table instead of one per
+        # counter
+        now = timezone.now()
+        session_cutoff = now - timedelta(minutes=5)
+        activity_cutoff = now - timedelta(hours=24)
+
+        room_stats = rooms.aggregate(
+            total=Count("id"),
+            active=Count("id", filter=Q(status="active")),
+        )
+        session_stats = sessions.aggregate(
+            total=Count("id"),
+            active=Count(
+                "id", filter=Q(status="active", last_seen__gte=session_cutoff)
+            ),
+        )
+        activity_stats = activities.aggregate(
+            total=Count("id"),
+            recent=Count("id", filter=Q(server_timestamp__gte=activity_cutoff)),
+        )
 
-        # Calculate statistics
         stats = {
-            "total_rooms": rooms.count(),
-            "active_rooms": rooms.filter(status="active").count(),
-            "total_sessions": sessions.count(),
-            "active_sessions": sessions.filter(
-                status="active", last_seen__gte=timezone.now() - timedelta(minutes=5)
-            ).count(),
-            "total_activities": activities.count(),
-            "recent_activities_count": activities.filter(
-                server_timestamp__gte=timezone.now() - timedelta(hours=24)
-            ).count(),
+            "total_rooms": room_stats["total"],
+            "active_rooms": room_stats["active"],
+            "total_sessions": session_stats["total"],
+            "active_sessions": session_stats["active"],
+            "total_activities": activity_stats["total"],
+            "recent_activities_count": activity_stats["recent"],
         }
 
         serializer = CollaborationStatsSerializer(stats)
@@ -225,9 +456,9 @@ class WebSocketTokenView(generics.GenericAPIView):
 
         room_id = serializer.validated_data["room_id"]
 
-        # Generate JWT token for WebSocket authentication
-        refresh = RefreshToken.for_user(request.user)
-        access_token = str(refresh.access_token)
+        # Generate JWT token for WebSocket authentication; only the access
+        # token is needed, so skip building (and signing) a refresh token
+        access_token = str(AccessToken.for_user(request.user))
 
         return Response(
             {
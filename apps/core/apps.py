@@ -1,3 +1,8 @@
+import atexit
+import logging
+import logging.handlers
+import queue
+
 from django.apps import AppConfig
 
 
@@ -5,3 +10,37 @@ class CoreConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.core"
     verbose_name = "Core"
+
+    def ready(self):
+        self._setup_request_log_queue()
+
+    @staticmethod
+    def _setup_request_log_queue():
+        """
+        Route django.request logging through an in-memory queue.
+
+        The API logging middleware emits several records per request; with
+        the default handlers each one is a synchronous write on the
+        response path. A QueueHandler makes the middleware's logger.info
+        calls a plain enqueue, while a background QueueListener drains to
+        the originally configured handlers.
+        """
+        request_logger = logging.getLogger("django.request")
+        if any(
+            isinstance(handler, logging.handlers.QueueHandler)
+            for handler in request_logger.handlers
+        ):
+            return  # Already wired (ready() can run more than once)
+
+        handlers = request_logger.handlers[:]
+        if not handlers:
+            return  # Nothing to drain to; leave propagation untouched
+
+        log_queue = queue.SimpleQueue()
+        request_logger.handlers = [logging.handlers.QueueHandler(log_queue)]
+
+        listener = logging.handlers.QueueListener(
+            log_queue, *handlers, respect_handler_level=True
+        )
+        listener.start()
+        atexit.register(listener.stop)
@@ -7,7 +7,7 @@ Usage:
 
 from django.contrib.auth import get_user_model
 from django.core.management.base import BaseCommand, CommandError
-from django.db import transaction
+from django.db import connection, transaction
 
 from apps.authentication.models import (
     EmailVerification,
@@ -23,6 +23,61 @@ User = get_user_model()
 class Command(BaseCommand):
     help = "Reset/clear all application data"
 
+    # Authentication tables cleared on every reset
+    AUXILIARY_MODELS = [
+        UserProfile,
+        LoginAttempt,
+        PasswordResetToken,
+        EmailVerification,
+        RefreshToken,
+    ]
+
+    # Batch size for chunked User deletion on the non-Postgres fallback
+    DELETE_CHUNK_SIZE = 5000
+
+    def _raw_delete_all(self, models):
+        """
+        Issue one DELETE per model via _raw_delete.
+
+        Skips the PK fetch, cascade collection, and signal dispatch of
+        queryset .delete() — safe here because these tables have no
+        FK cascade fanout of their own.
+        """
+        for model in models:
+            queryset = model.objects.all()
+            queryset._raw_delete(queryset.db)
+
+    def _chunked_delete(self, queryset):
+        """
+        Delete a queryset in pk-sliced batches.
+
+        Bounds memory on large tables: .delete() would otherwise pull
+        every PK (plus cascade rows) into Python in one go. Returns the
+        number of rows deleted from the queryset's own model.
+        """
+        deleted = 0
+        while True:
+            pks = list(
+                queryset.values_list("pk", flat=True)[: self.DELETE_CHUNK_SIZE]
+            )
+            if not pks:
+                return deleted
+            queryset.model.objects.filter(pk__in=pks).delete()
+            deleted += len(pks)
+
+    def _truncate_tables(self, models):
+        """
+        TRUNCATE the models' tables in a single statement.
+
+        Postgres-only fast path: skips fetching PKs into Python, signal
+        dispatch, and per-table DELETE round trips of ORM .delete().
+        """
+        tables = ", ".join(
+            connection.ops.quote_name(model._meta.db_table) for model in models
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(f"TRUNCATE {tables} RESTART IDENTITY CASCADE")
+
     def add_arguments(self, parser):
         parser.add_argument(
             "--confirm",
@@ -57,34 +112,49 @@ class Command(BaseCommand):
                 if options["keep_superuser"]:
                     # Delete non-superuser data
                     regular_users = User.objects.filter(is_superuser=False)
-                    regular_user_ids = list(regular_users.values_list("id", flat=True))
 
-                    UserProfile.objects.filter(user_id__in=regular_user_ids).delete()
-                    regular_users.delete()
+                    profiles = UserProfile.objects.filter(user__is_superuser=False)
+                    profiles._raw_delete(profiles.db)
+                    deleted_users = self._chunked_delete(regular_users)
 
                     # Clear other data
-                    LoginAttempt.objects.all().delete()
-                    PasswordResetToken.objects.all().delete()
-                    EmailVerification.objects.all().delete()
-                    RefreshToken.objects.all().delete()
+                    if connection.vendor == "postgresql":
+                        self._truncate_tables(
+                            [
+                                LoginAttempt,
+                                PasswordResetToken,
+                                EmailVerification,
+                                RefreshToken,
+                            ]
+                        )
+                    else:
+                        self._raw_delete_all(
+                            [
+                                LoginAttempt,
+                                PasswordResetToken,
+                                EmailVerification,
+                                RefreshToken,
+                            ]
+                        )
 
-                    remaining_users = User.objects.count()
+                    # Derive the remaining count from numbers already in
+                    # hand instead of a second COUNT round trip
+                    remaining_users = user_count - deleted_users
                     self.stdout.write(
                         self.style.SUCCESS(
                             f"✅ Data reset completed!\n"
-                            f"   - Deleted {user_count - remaining_users} regular users\n"
+                            f"   - Deleted {deleted_users} regular users\n"
                             f"   - Kept {remaining_users} superuser(s)\n"
                             f"   - Cleared all authentication data"
                         )
                     )
                 else:
                     # Delete all data
-                    UserProfile.objects.all().delete()
-                    LoginAttempt.objects.all().delete()
-                    PasswordResetToken.objects.all().delete()
-                    EmailVerification.objects.all().delete()
-                    RefreshToken.objects.all().delete()
-                    User.objects.all().delete()
+                    if connection.vendor == "postgresql":
+                        self._truncate_tables(self.AUXILIARY_MODELS + [User])
+                    else:
+                        self._raw_delete_all(self.AUXILIARY_MODELS)
+                        self._chunked_delete(User.objects.all())
 
                     self.stdout.write(
                         self.style.SUCCESS(
@@ -14,6 +14,7 @@ Usage:
 """
 
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
 from django.core.management.base import BaseCommand, CommandError
 from django.db import transaction
 
@@ -174,6 +175,12 @@ class Command(BaseCommand):
         ]
 
         created_users = []
+        profiles = []
+
+        # All sample users share one password: run the (deliberately slow)
+        # password hasher once instead of once per user. Fixtures only —
+        # real registration must keep hashing per user.
+        hashed_password = make_password("password123")
 
         for user_data in sample_users_data:
             username = user_data["username"]
@@ -184,39 +191,45 @@ class Command(BaseCommand):
                 )
                 user = User.objects.get(username=username)
             else:
-                user = User.objects.create_user(
+                user = User.objects.create(
                     username=username,
                     email=user_data["email"],
-                    password="password123",  # Default password for sample users
+                    password=hashed_password,
                     first_name=user_data["first_name"],
                     last_name=user_data["last_name"],
                 )
 
-                # Create UserProfile
-                UserProfile.objects.get_or_create(
-                    user=user,
-                    defaults={
-                        "bio": user_data["bio"],
-                        "phone_number": user_data["phone_number"],
-                        "user_timezone": "UTC",
-                        "language": "en",
-                        "theme": user_data["theme"],
-                        "email_notifications": True,
-                        "push_notifications": True,
-                        "preferences": {
+                # Collect UserProfiles for one batched insert below
+                profiles.append(
+                    UserProfile(
+                        user=user,
+                        bio=user_data["bio"],
+                        phone_number=user_data["phone_number"],
+                        user_timezone="UTC",
+                        language="en",
+                        theme=user_data["theme"],
+                        email_notifications=True,
+                        push_notifications=True,
+                        preferences={
                             "dashboard_layout": (
                                 "list" if user_data["theme"] == "dark" else "grid"
                             ),
                             "auto_save": True,
                             "collaboration_sounds": True,
                         },
-                    },
+                    )
                 )
 
                 self.stdout.write(self.style.SUCCESS(f'✅ User "{username}" created'))
 
             created_users.append(user)
 
+        # ignore_conflicts mimics get_or_create: profiles already created by
+        # the post_save signal are left untouched
+        UserProfile.objects.bulk_create(
+            profiles, batch_size=500, ignore_conflicts=True
+        )
+
         return created_users
 
     def create_comprehensive_data(self, sample_users):
@@ -236,25 +249,34 @@ class Command(BaseCommand):
 
         from apps.authentication.models import LoginAttempt
 
+        # Batch the sample rows into a single INSERT instead of one per row
+        attempts = []
         for user in sample_users[:2]:  # Create login attempts for first 2 users
             for i in range(random.randint(1, 3)):
-                LoginAttempt.objects.create(
-                    email=user.email,
-                    ip_address=f"192.168.1.{random.randint(100, 200)}",
-                    user_agent="Mozilla/5.0 (Test Browser)",
-                    success=random.choice([True, False]),
-                    device_info={
-                        "device_type": random.choice(["desktop", "mobile", "tablet"]),
-                        "os": random.choice(
-                            ["Windows", "macOS", "Linux", "iOS", "Android"]
-                        ),
-                        "browser": random.choice(
-                            ["Chrome", "Firefox", "Safari", "Edge"]
-                        ),
-                    },
-                    created_at=timezone.now() - timedelta(days=random.randint(1, 30)),
+                attempts.append(
+                    LoginAttempt(
+                        email=user.email,
+                        ip_address=f"192.168.1.{random.randint(100, 200)}",
+                        user_agent="Mozilla/5.0 (Test Browser)",
+                        success=random.choice([True, False]),
+                        device_info={
+                            "device_type": random.choice(
+                                ["desktop", "mobile", "tablet"]
+                            ),
+                            "os": random.choice(
+                                ["Windows", "macOS", "Linux", "iOS", "Android"]
+                            ),
+                            "browser": random.choice(
+                                ["Chrome", "Firefox", "Safari", "Edge"]
+                            ),
+                        },
+                        created_at=timezone.now()
+                        - timedelta(days=random.randint(1, 30)),
+                    )
                 )
 
+        LoginAttempt.objects.bulk_create(attempts, batch_size=500)
+
         self.stdout.write("✅ Comprehensive data created")
 
     def display_summary(self, options):
@@ -3,99 +3,178 @@ Custom middleware for logging API requests and responses.
 """
 
 import logging
+import re
 import time
 
 from django.utils.deprecation import MiddlewareMixin
+from django.utils.functional import SimpleLazyObject
 
 logger = logging.getLogger("django.request")
 
+# Indexed by status_code // 100 (clamped to 5) for response log lines
+STATUS_EMOJI = ("❓", "❓", "✅", "↩️", "⚠️", "🚨")
+
+# Bodies above this size, or with these content types, are never read for
+# logging: touching request.body would buffer the entire upload in memory
+# and break streaming multipart parsing downstream
+BODY_LOG_MAX_BYTES = 4096
+BODY_LOG_SKIP_TYPES = (
+    "multipart/",
+    "application/octet-stream",
+    "image/",
+    "video/",
+)
+
+# Matched against the raw bytes head of the body: one compiled-regex pass,
+# no decode or lowercased copy of the whole payload
+_SECRET_RE = re.compile(rb"(?i)password|token|secret|api[-_]?key|authorization")
+
 
 class APILoggingMiddleware(MiddlewareMixin):
     """
     Middleware to log API requests and responses in a readable format.
+
+    Each request produces exactly one log record, emitted on the response
+    path; request-side details (user, IP, body preview) are collected on
+    the request object and attached to the record via ``extra`` so
+    structured handlers can consume them without re-parsing the message.
     """
 
-    def process_request(self, request):
-        """Log incoming API requests."""
-        # Store start time for response time calculation
-        request._start_time = time.time()
-
-        # Only log API requests (not static files, admin, etc.)
-        if request.path.startswith("/api/"):
-            # Get user info
-            user_info = "Anonymous"
-            if hasattr(request, "user") and request.user.is_authenticated:
-                user_info = f"{request.user.username} (ID: {request.user.id})"
-
-            # Log the request
-            logger.info(
-                f"📥 {request.method} {request.path} | User: {user_info} | "
-                f"IP: {self.get_client_ip(request)}"
-            )
+    def __init__(self, get_response=None):
+        super().__init__(get_response)
+        # Snapshot the level check once per process: isEnabledFor walks
+        # the effective-level chain on every call otherwise. Changing the
+        # log level at runtime requires a process reload anyway.
+        self._info_enabled = logger.isEnabledFor(logging.INFO)
 
-            # Log request body for POST/PUT/PATCH (but limit size and exclude sensitive data)
-            if request.method in ["POST", "PUT", "PATCH"] and hasattr(request, "body"):
-                try:
-                    body = request.body.decode("utf-8")
-                    # Don't log passwords or tokens
-                    if "password" not in body.lower() and "token" not in body.lower():
-                        # Limit body size for logging
-                        if len(body) > 500:
-                            body = body[:500] + "... (truncated)"
-                        logger.info(f"📝 Request Body: {body}")
-                except (UnicodeDecodeError, AttributeError):
-                    logger.info("📝 Request Body: [Binary or non-UTF8 content]")
+    def process_request(self, request):
+        """Collect request-side log fields without emitting yet."""
+        # Non-API traffic (static files, admin, media, health checks) pays
+        # nothing here: no timer write, no further checks
+        if not request.path.startswith("/api/"):
+            return
+
+        # Store start time for response time calculation (monotonic, so a
+        # clock slew can't produce negative or inflated timings)
+        request._start_ns = time.perf_counter_ns()
+
+        # Only pay for formatting when an INFO handler will consume it
+        if not self._info_enabled:
+            return
+
+        # User info is resolved in process_response: touching request.user
+        # here would force the lazy auth lookup before the view needs it
+        record = {
+            "method": request.method,
+            "path": request.path,
+            "ip": self.get_client_ip(request),
+        }
+
+        # Preview request body for POST/PUT/PATCH (size-capped, redacted).
+        # No hasattr probe here: that would evaluate the body property and
+        # buffer the whole upload before get_body_preview's header checks
+        if request.method in ["POST", "PUT", "PATCH"]:
+            record["body_preview"] = self.get_body_preview(request)
+
+        request._api_log = record
 
     def process_response(self, request, response):
-        """Log API responses."""
-        # Only log API responses
-        if request.path.startswith("/api/"):
-            # Calculate response time
-            response_time = 0
-            if hasattr(request, "_start_time"):
-                response_time = (
-                    time.time() - request._start_time
-                ) * 1000  # Convert to milliseconds
-
-            # Get status emoji
-            status_emoji = self.get_status_emoji(response.status_code)
-
-            # Log the response
+        """Emit the single per-request log record."""
+        # Only log API responses; the timer doubles as the API-path flag
+        start_ns = getattr(request, "_start_ns", None)
+        if start_ns is not None and self._info_enabled:
+            # Calculate response time in milliseconds
+            response_time = (time.perf_counter_ns() - start_ns) / 1e6
+
+            # Prefer the Content-Length header; never touch .content on a
+            # streaming response, which would buffer it just for a log line
+            streaming = getattr(response, "streaming", False)
+            size = response.get("Content-Length")
+            if size:
+                size = int(size)
+            elif streaming:
+                size = -1
+            else:
+                size = len(response.content)
+
+            record = getattr(request, "_api_log", None) or {
+                "method": request.method,
+                "path": request.path,
+            }
+            record["status"] = response.status_code
+            record["duration_ms"] = round(response_time, 1)
+            record["size"] = size if size >= 0 else "stream"
+            record["user"] = self.get_user_info(request)
+
+            # Preview response body for errors (4xx, 5xx) but limit size
+            if response.status_code >= 400 and not streaming:
+                # Slice first: decode only the 300 bytes being logged, not
+                # the whole error payload
+                content = response.content[:300].decode("utf-8", errors="replace")
+                if len(response.content) > 300:
+                    content += "... (truncated)"
+                record["error_preview"] = content
+
+            # One logger call per request: one lock acquisition, one
+            # handler dispatch; structured handlers read the extra dict
             logger.info(
-                f"📤 {status_emoji} {response.status_code} {request.method} {request.path} | "
-                f"Time: {response_time:.1f}ms | Size: {len(response.content)} bytes"
+                "📤 %s %s %s %s | User: %s | IP: %s | Time: %.1fms | Size: %s bytes",
+                STATUS_EMOJI[min(response.status_code // 100, 5)],
+                response.status_code,
+                record["method"],
+                record["path"],
+                record.get("user", "-"),
+                record.get("ip", "-"),
+                response_time,
+                record["size"],
+                extra={"http": record},
             )
 
-            # Log response body for errors (4xx, 5xx) but limit size
-            if response.status_code >= 400:
-                try:
-                    content = response.content.decode("utf-8")
-                    if len(content) > 300:
-                        content = content[:300] + "... (truncated)"
-                    logger.info(f"❌ Error Response: {content}")
-                except (UnicodeDecodeError, AttributeError):
-                    logger.info("❌ Error Response: [Binary or non-UTF8 content]")
-
         return response
 
+    def get_user_info(self, request):
+        """
+        Describe the requesting user without triggering auth queries.
+
+        Reads only users already resolved during the request (the auth
+        middleware's _cached_user, or a concrete user assigned by DRF);
+        forcing a SimpleLazyObject here would add a SELECT per request
+        purely for logging.
+        """
+        user = getattr(request, "_cached_user", None)
+        if user is None:
+            direct = request.__dict__.get("user")
+            if direct is not None and not isinstance(direct, SimpleLazyObject):
+                user = direct
+        if user is not None and user.is_authenticated:
+            return f"{user.username} (ID: {user.id})"
+        return "Anonymous"
+
+    def get_body_preview(self, request):
+        """Build a size-capped, secret-redacted preview of the body."""
+        content_length = int(request.META.get("CONTENT_LENGTH") or 0)
+        content_type = request.META.get("CONTENT_TYPE", "")
+        if content_length > BODY_LOG_MAX_BYTES or content_type.startswith(
+            BODY_LOG_SKIP_TYPES
+        ):
+            return f"[skipped, {content_length} bytes {content_type}]"
+
+        # Don't log passwords, tokens or other credentials. The memoryview
+        # slices are zero-copy; only the 500-byte preview is ever
+        # materialized and decoded.
+        head = memoryview(request.body)[:BODY_LOG_MAX_BYTES]
+        if _SECRET_RE.search(head):
+            return "[redacted]"
+
+        body = bytes(head[:500]).decode("utf-8", errors="replace")
+        if content_length > 500:
+            body += "... (truncated)"
+        return body
+
     def get_client_ip(self, request):
         """Get the client's IP address."""
         x_forwarded_for = request.META.get("HTTP_X_FORWARDED_FOR")
         if x_forwarded_for:
-            ip = x_forwarded_for.split(",")[0]
-        else:
-            ip = request.META.get("REMOTE_ADDR")
-        return ip
-
-    def get_status_emoji(self, status_code):
-        """Get emoji based on HTTP status code."""
-        if 200 <= status_code < 300:
-            return "✅"
-        elif 300 <= status_code < 400:
-            return "↩️"
-        elif 400 <= status_code < 500:
-            return "⚠️"
-        elif status_code >= 500:
-            return "🚨"
-        else:
-            return "❓"
+            # partition() reads the first token without allocating a list
+            return x_forwarded_for.partition(",")[0].strip()
+        return request.META.get("REMOTE_ADDR")
@@ -5,3 +5,7 @@ class DocumentsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.documents"
     verbose_name = "Documents"
+
+    def ready(self):
+        """Import signals when the app is ready."""
+        from . import signals  # noqa: F401
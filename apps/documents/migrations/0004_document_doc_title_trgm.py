@@ -0,0 +1,24 @@
+# Generated by Django 5.2.17 on 2026-08-28 02:44
+
+import django.contrib.postgres.indexes
+from django.conf import settings
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('documents', '0003_document_draft_content_document_has_unsaved_changes_and_more'),
+        ('organizations', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        # gin_trgm_ops requires the pg_trgm extension
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name='document',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['title'], name='doc_title_trgm', opclasses=['gin_trgm_ops']),
+        ),
+    ]
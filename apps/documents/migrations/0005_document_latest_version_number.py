@@ -0,0 +1,35 @@
+# Generated by Django 5.2.17 on 2026-08-28 02:54
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_latest_version_number(apps, schema_editor):
+    """Seed the counter from each document's existing version history."""
+    Document = apps.get_model("documents", "Document")
+    DocumentVersion = apps.get_model("documents", "DocumentVersion")
+    latest = (
+        DocumentVersion.objects.filter(document=OuterRef("pk"))
+        .order_by("-version_number")
+        .values("version_number")[:1]
+    )
+    Document.objects.update(latest_version_number=Coalesce(Subquery(latest), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('documents', '0004_document_doc_title_trgm'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='document',
+            name='latest_version_number',
+            field=models.PositiveIntegerField(default=0, help_text='Highest version number created for this document'),
+        ),
+        migrations.RunPython(
+            backfill_latest_version_number, migrations.RunPython.noop
+        ),
+    ]
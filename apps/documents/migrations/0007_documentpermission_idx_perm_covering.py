@@ -0,0 +1,19 @@
+# Generated by Django 5.2.17 on 2026-08-28 02:59
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('documents', '0006_document_idx_doc_tags_gin_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='documentpermission',
+            index=models.Index(fields=['document', 'user'], include=('permission_level',), name='idx_perm_covering'),
+        ),
+    ]
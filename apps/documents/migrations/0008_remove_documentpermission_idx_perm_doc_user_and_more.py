@@ -0,0 +1,21 @@
+# Generated by Django 5.2.17 on 2026-08-28 03:00
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('documents', '0007_documentpermission_idx_perm_covering'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='documentpermission',
+            name='idx_perm_doc_user',
+        ),
+        migrations.RemoveIndex(
+            model_name='documentversion',
+            name='idx_ver_doc_num',
+        ),
+    ]
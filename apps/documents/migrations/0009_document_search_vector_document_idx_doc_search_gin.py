@@ -0,0 +1,43 @@
+# Generated by Django 5.2.17 on 2026-08-28 03:01
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.conf import settings
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('documents', '0008_remove_documentpermission_idx_perm_doc_user_and_more'),
+        ('organizations', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='document',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='document',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='idx_doc_search_gin'),
+        ),
+        # Maintain the vector in the database so Python saves don't pay
+        # for it; the no-op UPDATE backfills existing rows via the trigger
+        migrations.RunSQL(
+            sql="""
+                CREATE TRIGGER documents_search_vector_update
+                BEFORE INSERT OR UPDATE OF title, content_text ON documents
+                FOR EACH ROW EXECUTE FUNCTION tsvector_update_trigger(
+                    search_vector, 'pg_catalog.english', title, content_text
+                );
+                UPDATE documents SET title = title;
+            """,
+            reverse_sql="""
+                DROP TRIGGER IF EXISTS documents_search_vector_update
+                ON documents;
+            """,
+        ),
+    ]
@@ -4,9 +4,28 @@ Permission classes for documents app.
 
 from rest_framework import permissions
 
+from apps.organizations.models import TeamMembership
+
 from .models import Document
 
 
+def _request_team_ids(request):
+    """Return the requesting user's active team ids, memoized per request.
+
+    One membership query serves every object checked during the request
+    instead of an EXISTS per document on list views.
+    """
+    team_ids = getattr(request, "_user_team_ids", None)
+    if team_ids is None:
+        team_ids = set(
+            TeamMembership.objects.filter(
+                user=request.user, status="active"
+            ).values_list("team_id", flat=True)
+        )
+        request._user_team_ids = team_ids
+    return team_ids
+
+
 class IsDocumentReader(permissions.BasePermission):
     """
     Permission class for document read access.
@@ -90,9 +109,7 @@ class IsTeamMemberForDocument(permissions.BasePermission):
     def has_object_permission(self, request, view, obj):
         """Check if user is a team member."""
         if isinstance(obj, Document):
-            return obj.team.memberships.filter(
-                user=request.user, status="active"
-            ).exists()
+            return obj.team_id in _request_team_ids(request)
         return False
 
 
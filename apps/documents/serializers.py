@@ -2,8 +2,12 @@
 Serializers for documents app.
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 from django.contrib.auth.models import User
 from django.db import transaction
+from django.db.models import F, Prefetch
 from rest_framework import serializers
 
 from apps.organizations.models import Team
@@ -15,6 +19,15 @@ from .models import (
     DocumentPermission,
     DocumentVersion,
 )
+from .permissions import _request_team_ids
+
+# Media type by the major part of the MIME type; application/pdf is the
+# one exact match handled separately
+_MEDIA_TYPE_MAP = {
+    "image": "image",
+    "video": "video",
+    "audio": "audio",
+}
 
 
 class UserBasicSerializer(serializers.ModelSerializer):
@@ -25,6 +38,20 @@ class UserBasicSerializer(serializers.ModelSerializer):
         fields = ["id", "username", "first_name", "last_name", "email"]
         read_only_fields = ["id", "username", "first_name", "last_name", "email"]
 
+    def to_representation(self, instance):
+        """Serialize each distinct user once per request.
+
+        The same author recurs across created_by/updated_by/comment
+        users in a single response; reusing the dict skips re-running
+        the field machinery for every repeat.
+        """
+        cache = self.context.setdefault("_user_cache", {})
+        data = cache.get(instance.id)
+        if data is None:
+            data = super().to_representation(instance)
+            cache[instance.id] = data
+        return data
+
 
 class DocumentMediaSerializer(serializers.ModelSerializer):
     """Serializer for document media attachments."""
@@ -89,35 +116,85 @@ class DocumentMediaCreateSerializer(serializers.ModelSerializer):
 
     def create(self, validated_data):
         """Create media attachment with metadata extraction."""
-        import os
+        media = self._build_media(
+            validated_data, self.context["document"], self.context["request"].user
+        )
+        media.save()
+        return media
+
+    @classmethod
+    def bulk_create(cls, validated_data_list, context):
+        """Create several media attachments with a single INSERT.
+
+        Image dimension probes run in a thread pool -- Pillow releases
+        the GIL while reading headers -- then every row goes to the
+        database in one bulk_create. Bulk inserts skip the post_save
+        counter signal, so media_count is advanced here directly.
+        """
+        document = context["document"]
+        user = context["request"].user
+
+        with ThreadPoolExecutor(
+            max_workers=min(4, len(validated_data_list))
+        ) as executor:
+            media_objects = list(
+                executor.map(
+                    lambda data: cls._build_media(data, document, user),
+                    validated_data_list,
+                )
+            )
 
+        created = DocumentMedia.objects.bulk_create(media_objects)
+        Document.objects.filter(pk=document.pk).update(
+            media_count=F("media_count") + len(created)
+        )
+        return created
+
+    @classmethod
+    def _build_media(cls, validated_data, document, user):
+        """Build an unsaved DocumentMedia with extracted metadata."""
         file_obj = validated_data["file"]
-        validated_data["document"] = self.context["document"]
-        validated_data["uploaded_by"] = self.context["request"].user
-        validated_data["original_filename"] = file_obj.name
-        validated_data["filename"] = os.path.splitext(file_obj.name)[0]
-        validated_data["file_size"] = file_obj.size
+        media = DocumentMedia(
+            document=document,
+            uploaded_by=user,
+            original_filename=file_obj.name,
+            filename=os.path.splitext(file_obj.name)[0],
+            file_size=file_obj.size,
+            **validated_data,
+        )
 
         # Basic MIME type detection
-        if hasattr(file_obj, "content_type") and file_obj.content_type:
-            validated_data["mime_type"] = file_obj.content_type
-
-            # Determine media type from MIME type
-            if file_obj.content_type.startswith("image/"):
-                validated_data["media_type"] = "image"
-            elif file_obj.content_type.startswith("video/"):
-                validated_data["media_type"] = "video"
-            elif file_obj.content_type.startswith("audio/"):
-                validated_data["media_type"] = "audio"
-            elif file_obj.content_type == "application/pdf":
-                validated_data["media_type"] = "pdf"
+        content_type = getattr(file_obj, "content_type", None)
+        if content_type:
+            media.mime_type = content_type
+            if content_type == "application/pdf":
+                media.media_type = "pdf"
             else:
-                validated_data["media_type"] = "other"
+                media.media_type = _MEDIA_TYPE_MAP.get(
+                    content_type.partition("/")[0], "other"
+                )
         else:
-            validated_data["mime_type"] = "application/octet-stream"
-            validated_data["media_type"] = "other"
+            media.mime_type = "application/octet-stream"
+            media.media_type = "other"
+
+        if media.media_type == "image":
+            media.width, media.height = cls._image_dimensions(file_obj)
 
-        return super().create(validated_data)
+        return media
+
+    @staticmethod
+    def _image_dimensions(file_obj):
+        """Best-effort width/height for image uploads."""
+        try:
+            from PIL import Image
+
+            with Image.open(file_obj) as image:
+                dimensions = (image.width, image.height)
+            file_obj.seek(0)
+            return dimensions
+        except Exception:
+            # Unreadable or not actually an image; dimensions stay unset
+            return (None, None)
 
 
 class DocumentVersionSerializer(serializers.ModelSerializer):
@@ -189,31 +266,36 @@ class DocumentPermissionSerializer(serializers.ModelSerializer):
 
     def validate_user_id(self, value):
         """Validate that user exists and is a team member."""
-        try:
-            user = User.objects.get(id=value)
-        except User.DoesNotExist:
-            raise serializers.ValidationError("User does not exist")
-
         document = self.context.get("document")
-        if (
-            document
-            and not document.team.memberships.filter(
-                user=user, status="active"
-            ).exists()
-        ):
-            raise serializers.ValidationError(
-                "User must be a team member to receive permissions"
-            )
+        if document is not None:
+            # One query resolves both checks: joining through the
+            # membership only matches users active on the document's team
+            user = User.objects.filter(
+                id=value,
+                team_memberships__team=document.team,
+                team_memberships__status="active",
+            ).first()
+            if user is None:
+                # Failure path only: tell the caller which check failed
+                if not User.objects.filter(id=value).exists():
+                    raise serializers.ValidationError("User does not exist")
+                raise serializers.ValidationError(
+                    "User must be a team member to receive permissions"
+                )
+        else:
+            user = User.objects.filter(id=value).first()
+            if user is None:
+                raise serializers.ValidationError("User does not exist")
 
+        self._validated_user = user
         return value
 
     def create(self, validated_data):
         """Create document permission."""
-        user_id = validated_data.pop("user_id")
-        user = User.objects.get(id=user_id)
+        validated_data.pop("user_id")
 
         return DocumentPermission.objects.create(
-            user=user,
+            user=self._validated_user,
             granted_by=self.context["request"].user,
             document=self.context["document"],
             **validated_data,
@@ -259,12 +341,19 @@ class DocumentCommentSerializer(serializers.ModelSerializer):
 
     def get_replies(self, obj):
         """Get replies to this comment."""
-        if obj.parent_comment is None:  # Only show replies for top-level comments
-            replies = obj.replies.all()
-            return DocumentCommentSerializer(
-                replies, many=True, context=self.context
-            ).data
-        return []
+        # parent_comment_id avoids fetching the parent row just to test
+        # for None. Only top-level comments list their replies.
+        if obj.parent_comment_id is not None:
+            return []
+        # The comments endpoint serializes the whole thread in one flat
+        # many=True pass and splices replies in afterwards, so no nested
+        # serializer is built here; the relation fallback only serves
+        # objects serialized outside that view
+        if "replies_by_parent" in self.context:
+            return []
+        return DocumentCommentSerializer(
+            obj.replies.all(), many=True, context=self.context
+        ).data
 
     def create(self, validated_data):
         """Create document comment."""
@@ -275,6 +364,92 @@ class DocumentCommentSerializer(serializers.ModelSerializer):
         )
 
 
+# Columns the list endpoint reads as plain values() rows; the user
+# permission fallback additionally needs team_id and the annotations
+# from DocumentViewSet.get_queryset
+DOCUMENT_LIST_COLUMNS = (
+    "id",
+    "title",
+    "document_type",
+    "status",
+    "is_public",
+    "word_count",
+    "character_count",
+    "media_count",
+    "tags",
+    "latest_version_number",
+    "created_at",
+    "updated_at",
+    "team_id",
+    "team__name",
+    "created_by__id",
+    "created_by__username",
+    "created_by__first_name",
+    "created_by__last_name",
+    "created_by__email",
+    "updated_by__id",
+    "updated_by__username",
+    "updated_by__first_name",
+    "updated_by__last_name",
+    "updated_by__email",
+    "_user_perm_level",
+    "_comment_count",
+)
+
+
+def serialize_document_list(rows, request):
+    """Shape values() rows into the document list payload.
+
+    Produces the same structure as DocumentListSerializer without
+    instantiating serializer fields per row; the list action feeds it
+    pages of dict rows straight from the database, which skips both
+    model construction and DRF field binding on the hottest endpoint.
+    """
+    team_ids = _request_team_ids(request)
+    data = []
+    for row in rows:
+        permission = row["_user_perm_level"]
+        if permission is None and row["is_public"] and row["team_id"] in team_ids:
+            permission = "read"
+        updated_by = None
+        if row["updated_by__id"] is not None:
+            updated_by = {
+                "id": row["updated_by__id"],
+                "username": row["updated_by__username"],
+                "first_name": row["updated_by__first_name"],
+                "last_name": row["updated_by__last_name"],
+                "email": row["updated_by__email"],
+            }
+        data.append(
+            {
+                "id": row["id"],
+                "title": row["title"],
+                "document_type": row["document_type"],
+                "status": row["status"],
+                "is_public": row["is_public"],
+                "word_count": row["word_count"],
+                "character_count": row["character_count"],
+                "media_count": row["media_count"],
+                "tags": row["tags"],
+                "team_name": row["team__name"],
+                "created_by": {
+                    "id": row["created_by__id"],
+                    "username": row["created_by__username"],
+                    "first_name": row["created_by__first_name"],
+                    "last_name": row["created_by__last_name"],
+                    "email": row["created_by__email"],
+                },
+                "updated_by": updated_by,
+                "current_version": row["latest_version_number"],
+                "comment_count": row["_comment_count"],
+                "user_permission": permission,
+                "created_at": row["created_at"],
+                "updated_at": row["updated_at"],
+            }
+        )
+    return data
+
+
 class DocumentListSerializer(serializers.ModelSerializer):
     """Serializer for document list view."""
 
@@ -307,14 +482,60 @@ class DocumentListSerializer(serializers.ModelSerializer):
             "updated_at",
         ]
 
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Attach the relations this serializer's fields read.
+
+        Kept on the serializer so the query plan stays in step with the
+        declared fields; the viewset calls it when building its queryset.
+        The only() list mirrors the declared fields so the potentially
+        large content/draft_content JSON and content_text never leave
+        the database on list views.
+        """
+        return queryset.select_related("team", "created_by", "updated_by").only(
+            "id",
+            "title",
+            "document_type",
+            "status",
+            "is_public",
+            "word_count",
+            "character_count",
+            "media_count",
+            "tags",
+            "latest_version_number",
+            "created_at",
+            "updated_at",
+            "team__id",
+            "team__name",
+            "created_by__id",
+            "created_by__username",
+            "created_by__first_name",
+            "created_by__last_name",
+            "created_by__email",
+            "updated_by__id",
+            "updated_by__username",
+            "updated_by__first_name",
+            "updated_by__last_name",
+            "updated_by__email",
+        )
+
     def get_comment_count(self, obj):
         """Get total comment count."""
+        # Annotated in bulk by DocumentViewSet.get_queryset; the COUNT
+        # fallback only runs for objects serialized outside the viewset
+        count = obj.__dict__.get("_comment_count")
+        if count is not None:
+            return count
         return obj.comments.count()
 
     def get_user_permission(self, obj):
         """Get current user's permission level."""
-        user = self.context["request"].user
-        return obj.get_user_permission(user)
+        # Membership comes from the request-scoped team id set, so the
+        # no-explicit-grant fallback costs no query per document
+        request = self.context["request"]
+        return obj.get_user_permission(
+            request.user, team_member=obj.team_id in _request_team_ids(request)
+        )
 
 
 class DocumentDetailSerializer(serializers.ModelSerializer):
@@ -365,21 +586,58 @@ class DocumentDetailSerializer(serializers.ModelSerializer):
             "updated_at",
         ]
 
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Attach the relations this serializer's fields read."""
+        return queryset.select_related(
+            "team", "created_by", "updated_by"
+        ).prefetch_related(
+            # Embedded media with uploader, and the newest version
+            # (matched via the denormalized counter) with its author
+            Prefetch(
+                "media_attachments",
+                queryset=DocumentMedia.objects.select_related("uploaded_by"),
+            ),
+            Prefetch(
+                "versions",
+                queryset=DocumentVersion.objects.select_related(
+                    "created_by"
+                ).filter(version_number=F("document__latest_version_number")),
+                to_attr="_latest_versions",
+            ),
+        )
+
     def get_user_permission(self, obj):
         """Get current user's permission level."""
-        user = self.context["request"].user
-        return obj.get_user_permission(user)
+        # Membership comes from the request-scoped team id set, so the
+        # no-explicit-grant fallback costs no query per document
+        request = self.context["request"]
+        return obj.get_user_permission(
+            request.user, team_member=obj.team_id in _request_team_ids(request)
+        )
 
     def get_latest_content(self, obj):
         """Get the most recent content (draft or published)."""
-        return obj.get_latest_content()
+        # Memoized per request so repeat serializations of the same
+        # document (many=True, nested reuse) resolve the draft-vs-
+        # published choice once
+        cache = self.context.setdefault("_latest_content", {})
+        if obj.id not in cache:
+            cache[obj.id] = obj.get_latest_content()
+        return cache[obj.id]
 
     def get_permissions_count(self, obj):
         """Get total permissions count."""
+        count = obj.__dict__.get("_permissions_count")
+        if count is not None:
+            return count
         return obj.permissions.count()
 
     def get_comment_count(self, obj):
         """Get total comment count."""
+        count = obj.__dict__.get("_comment_count")
+        if count is not None:
+            return count
         return obj.comments.count()
 
 
@@ -390,14 +648,12 @@ class DocumentAutoSaveSerializer(serializers.Serializer):
 
     def validate_content(self, value):
         """Validate the content structure."""
-        if not isinstance(value, dict):
+        # Runs on every auto-save burst; parsed JSON objects are always
+        # plain dicts, so the exact-type check is the cheapest guard.
+        # Any rich-text "type" value is accepted for flexibility.
+        if value.__class__ is not dict:
             raise serializers.ValidationError("Content must be a valid JSON object")
 
-        # Basic validation for common rich text formats
-        if "type" in value and value["type"] not in ["doc", "paragraph", "text"]:
-            # Allow any type for flexibility, but warn about unknown types
-            pass
-
         return value
 
 
@@ -444,33 +700,55 @@ class DocumentCreateSerializer(serializers.ModelSerializer):
         if not team.memberships.filter(user=user, status="active").exists():
             raise serializers.ValidationError("You are not a member of this team")
 
+        # create() reuses this instead of refetching by id
+        self._team = team
         return value
 
     def create(self, validated_data):
         """Create document with proper associations."""
-        team_id = validated_data.pop("team_id")
-        team = Team.objects.get(id=team_id)
+        validated_data.pop("team_id")
+        team = self._team
         user = self.context["request"].user
 
         with transaction.atomic():
-            # Create document
+            # Create document; the version counter starts at 1 because
+            # the initial version is inserted below
             document = Document.objects.create(
                 team=team,
                 created_by=user,
                 updated_by=user,
+                latest_version_number=1,
                 **validated_data,
             )
 
-            # Create initial version
-            document.create_version(user=user, change_summary="Initial version")
-
-            # Grant admin permission to creator
-            DocumentPermission.objects.create(
-                document=document,
-                user=user,
-                permission_level="admin",
-                granted_by=user,
-                notes="Document creator",
+            # Initial version and creator grant in one INSERT each.
+            # bulk_create skips DocumentVersion.save(), so the derived
+            # text fields are copied from the freshly saved document
+            DocumentVersion.objects.bulk_create(
+                [
+                    DocumentVersion(
+                        document=document,
+                        version_number=1,
+                        title=document.title,
+                        content=document.content,
+                        content_text=document.content_text,
+                        word_count=document.word_count,
+                        character_count=document.character_count,
+                        change_summary="Initial version",
+                        created_by=user,
+                    )
+                ]
+            )
+            DocumentPermission.objects.bulk_create(
+                [
+                    DocumentPermission(
+                        document=document,
+                        user=user,
+                        permission_level="admin",
+                        granted_by=user,
+                        notes="Document creator",
+                    )
+                ]
             )
 
         return document
@@ -0,0 +1,32 @@
+"""
+Signals for documents app.
+
+Keeps the denormalized Document.media_count column in step with the
+media table so reads never have to COUNT attachments.
+"""
+
+from django.db.models import F
+from django.db.models.functions import Greatest
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Document, DocumentMedia
+
+
+@receiver(post_save, sender=DocumentMedia)
+def increment_media_count(sender, instance, created, **kwargs):
+    """Bump the parent document's media counter on new attachments."""
+    if created:
+        Document.objects.filter(pk=instance.document_id).update(
+            media_count=F("media_count") + 1
+        )
+
+
+@receiver(post_delete, sender=DocumentMedia)
+def decrement_media_count(sender, instance, **kwargs):
+    """Drop the parent document's media counter when media is removed."""
+    # Clamped at zero: PositiveIntegerField carries a CHECK constraint,
+    # so a stale counter must not push the update below it
+    Document.objects.filter(pk=instance.document_id).update(
+        media_count=Greatest(F("media_count") - 1, 0)
+    )
@@ -2,7 +2,10 @@
 API views for documents app.
 """
 
-from django.db.models import Count, Q, Sum
+from collections import defaultdict
+
+from django.contrib.postgres.search import SearchQuery
+from django.db.models import Count, OuterRef, Subquery, Sum
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
 from drf_spectacular.utils import extend_schema, extend_schema_view
@@ -15,7 +18,13 @@ from rest_framework.viewsets import ModelViewSet
 
 from apps.organizations.models import Team
 
-from .models import Document, DocumentComment, DocumentMedia
+from .models import (
+    Document,
+    DocumentComment,
+    DocumentMedia,
+    DocumentPermission,
+    DocumentVersion,
+)
 from .permissions import (
     CanCommentOnDocument,
     CanManageDocumentPermissions,
@@ -23,6 +32,7 @@ from .permissions import (
     IsDocumentReader,
 )
 from .serializers import (
+    DOCUMENT_LIST_COLUMNS,
     DocumentAutoSaveSerializer,
     DocumentCommentSerializer,
     DocumentCreateSerializer,
@@ -36,6 +46,7 @@ from .serializers import (
     DocumentUpdateSerializer,
     DocumentVersionCreateSerializer,
     DocumentVersionSerializer,
+    serialize_document_list,
 )
 
 
@@ -99,12 +110,11 @@ class DocumentViewSet(DocumentPermissionMixin, ModelViewSet):
         if doc_type:
             queryset = queryset.filter(document_type=doc_type)
 
-        # Search by title or content
+        # Search by title or content via the GIN-backed tsvector column
+        # instead of ILIKE scans over title and the whole content JSON
         search = self.request.query_params.get("search")
         if search:
-            queryset = queryset.filter(
-                Q(title__icontains=search) | Q(content__icontains=search)
-            )
+            queryset = queryset.filter(search_vector=SearchQuery(search))
 
         # Filter by tags
         tags = self.request.query_params.get("tags")
@@ -112,9 +122,53 @@ class DocumentViewSet(DocumentPermissionMixin, ModelViewSet):
             tag_list = [tag.strip() for tag in tags.split(",")]
             queryset = queryset.filter(tags__overlap=tag_list)
 
-        return queryset.select_related(
-            "team", "created_by", "updated_by"
-        ).prefetch_related("permissions", "comments")
+        # The permissions/comments data the serializers need all comes
+        # from the annotations below, so blanket prefetches of those
+        # relations would only add queries whose caches nothing reads
+        queryset = (
+            queryset.select_related("team", "created_by", "updated_by")
+            # Expose the caller's explicit grant in the main query so
+            # get_user_permission (and the DRF permission classes built on
+            # it) don't issue one SELECT per document on list views; the
+            # counts likewise replace one COUNT per serialized row
+            .annotate(
+                _user_perm_level=Subquery(
+                    DocumentPermission.objects.filter(
+                        document=OuterRef("pk"), user=user
+                    ).values("permission_level")[:1]
+                ),
+                _comment_count=Count("comments", distinct=True),
+                _permissions_count=Count("permissions", distinct=True),
+            )
+        )
+
+        # Each serializer declares the joins/prefetches its fields read;
+        # routing list and retrieve through it keeps the query plan in
+        # step with the serializer. Custom actions keep the lean base
+        # query rather than paying for the detail prefetches.
+        if self.action in ("list", "retrieve"):
+            queryset = self.get_serializer_class().setup_eager_loading(queryset)
+
+        return queryset
+
+    def list(self, request, *args, **kwargs):
+        """List documents from plain values() rows.
+
+        The list payload is flat enough that DRF's per-row field
+        machinery only adds overhead; fetching dict rows and shaping
+        them in serialize_document_list skips model construction and
+        field binding entirely. DocumentListSerializer remains the
+        schema/source of truth for the response shape.
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        rows = queryset.values(*DOCUMENT_LIST_COLUMNS)
+
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(
+                serialize_document_list(page, request)
+            )
+        return Response(serialize_document_list(rows, request))
 
     def get_serializer_class(self):
         """Return appropriate serializer class."""
@@ -234,16 +288,39 @@ class DocumentViewSet(DocumentPermissionMixin, ModelViewSet):
         document = self.get_object()
 
         if request.method == "GET":
-            # Get top-level comments (not replies)
-            comments = (
-                document.comments.filter(parent_comment=None)
-                .select_related("user", "resolved_by")
-                .prefetch_related("replies__user")
+            # Fetch the whole thread once and serialize it in a single
+            # flat many=True pass -- one ListSerializer instead of a
+            # nested serializer per parent -- then splice the reply dicts
+            # under their parents by id
+            all_comments = list(
+                document.comments.select_related("user", "resolved_by")
+                # One aggregate in the main query instead of a COUNT per
+                # comment when the serializer reads reply_count
+                .annotate(_reply_count=Count("replies"))
             )
+            replies_by_parent = defaultdict(list)
+            for comment in all_comments:
+                if comment.parent_comment_id is not None:
+                    replies_by_parent[comment.parent_comment_id].append(comment)
             serializer = DocumentCommentSerializer(
-                comments, many=True, context={"request": request}
+                all_comments,
+                many=True,
+                context={
+                    "request": request,
+                    "replies_by_parent": replies_by_parent,
+                },
             )
-            return Response(serializer.data)
+            rendered = serializer.data
+            data_by_id = {c.id: d for c, d in zip(all_comments, rendered)}
+            top_level = []
+            for comment, data in zip(all_comments, rendered):
+                if comment.parent_comment_id is None:
+                    data["replies"] = [
+                        data_by_id[reply.id]
+                        for reply in replies_by_parent.get(comment.id, ())
+                    ]
+                    top_level.append(data)
+            return Response(top_level)
 
         elif request.method == "POST":
             serializer = DocumentCommentSerializer(
@@ -333,6 +410,34 @@ class DocumentViewSet(DocumentPermissionMixin, ModelViewSet):
                     status=status.HTTP_403_FORBIDDEN,
                 )
 
+            # Batch path: several files under the same "file" key are
+            # validated individually, then metadata extraction fans out
+            # and the rows land in one INSERT
+            files = request.FILES.getlist("file")
+            if len(files) > 1:
+                shared = {
+                    key: value
+                    for key, value in request.data.items()
+                    if key != "file"
+                }
+                validated = []
+                for file_obj in files:
+                    serializer = DocumentMediaCreateSerializer(
+                        data={**shared, "file": file_obj}
+                    )
+                    if not serializer.is_valid():
+                        return Response(
+                            serializer.errors, status=status.HTTP_400_BAD_REQUEST
+                        )
+                    validated.append(serializer.validated_data)
+                created = DocumentMediaCreateSerializer.bulk_create(
+                    validated, context={"request": request, "document": document}
+                )
+                return Response(
+                    DocumentMediaSerializer(created, many=True).data,
+                    status=status.HTTP_201_CREATED,
+                )
+
             serializer = DocumentMediaCreateSerializer(
                 data=request.data, context={"request": request, "document": document}
             )
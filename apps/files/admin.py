@@ -12,7 +12,7 @@ from .models import FilePermission, FileShare, FileUpload
 class FileUploadAdmin(admin.ModelAdmin):
     """Admin interface for FileUpload model."""
 
-    list_display = [
+    list_display = (
         "original_name",
         "file_type",
         "human_readable_size",
@@ -22,28 +22,28 @@ class FileUploadAdmin(admin.ModelAdmin):
         "virus_scan_status",
         "is_public",
         "created_at",
-    ]
+    )
 
-    list_filter = [
+    list_filter = (
         "file_type",
         "upload_status",
         "virus_scan_status",
         "is_public",
         "is_image",
         "team",
-        "created_at",
-    ]
+    )
+    date_hierarchy = "created_at"
 
-    search_fields = [
+    search_fields = (
         "original_name",
         "file_name",
         "description",
         "uploaded_by__username",
         "uploaded_by__email",
         "team__name",
-    ]
+    )
 
-    readonly_fields = [
+    readonly_fields = (
         "id",
         "file_name",
         "file_size",
@@ -59,7 +59,7 @@ class FileUploadAdmin(admin.ModelAdmin):
         "created_at",
         "updated_at",
         "file_preview",
-    ]
+    )
 
     fieldsets = (
         (
@@ -135,6 +135,12 @@ class FileUploadAdmin(admin.ModelAdmin):
         ),
     )
 
+    # Changelist tuning: declarative joins, smaller pages, and no
+    # unfiltered COUNT(*) alongside the filtered one
+    list_select_related = ("team", "uploaded_by", "document")
+    list_per_page = 50
+    show_full_result_count = False
+
     def get_queryset(self, request):
         """Optimize queryset with select_related."""
         return (
@@ -159,31 +165,28 @@ class FileUploadAdmin(admin.ModelAdmin):
 class FilePermissionAdmin(admin.ModelAdmin):
     """Admin interface for FilePermission model."""
 
-    list_display = [
+    list_display = (
         "file",
         "user",
         "permission_level",
         "granted_by",
         "granted_at",
-    ]
+    )
 
-    list_filter = [
-        "permission_level",
-        "granted_at",
-        "file__team",
-    ]
+    list_filter = ("permission_level", "file__team")
+    date_hierarchy = "granted_at"
 
-    search_fields = [
+    search_fields = (
         "file__original_name",
         "user__username",
         "user__email",
         "granted_by__username",
-    ]
+    )
 
-    readonly_fields = [
+    readonly_fields = (
         "id",
         "granted_at",
-    ]
+    )
 
     fieldsets = (
         (
@@ -209,6 +212,12 @@ class FilePermissionAdmin(admin.ModelAdmin):
         ),
     )
 
+    # Changelist tuning: declarative joins, smaller pages, and no
+    # unfiltered COUNT(*) alongside the filtered one
+    list_select_related = ("file", "user", "granted_by")
+    list_per_page = 50
+    show_full_result_count = False
+
     def get_queryset(self, request):
         """Optimize queryset with select_related."""
         return (
@@ -220,7 +229,7 @@ class FilePermissionAdmin(admin.ModelAdmin):
 class FileShareAdmin(admin.ModelAdmin):
     """Admin interface for FileShare model."""
 
-    list_display = [
+    list_display = (
         "file",
         "share_type",
         "password_protected",
@@ -229,22 +238,18 @@ class FileShareAdmin(admin.ModelAdmin):
         "is_active",
         "created_by",
         "created_at",
-    ]
+    )
 
-    list_filter = [
-        "share_type",
-        "password_protected",
-        "created_at",
-        "expires_at",
-    ]
+    list_filter = ("share_type", "password_protected")
+    date_hierarchy = "created_at"
 
-    search_fields = [
+    search_fields = (
         "file__original_name",
         "share_token",
         "created_by__username",
-    ]
+    )
 
-    readonly_fields = [
+    readonly_fields = (
         "id",
         "share_token",
         "access_count",
@@ -255,7 +260,7 @@ class FileShareAdmin(admin.ModelAdmin):
         "is_download_limit_reached",
         "is_active",
         "share_url_display",
-    ]
+    )
 
     fieldsets = (
         (
@@ -313,6 +318,12 @@ class FileShareAdmin(admin.ModelAdmin):
         ),
     )
 
+    # Changelist tuning: declarative joins, smaller pages, and no
+    # unfiltered COUNT(*) alongside the filtered one
+    list_select_related = ("file", "created_by")
+    list_per_page = 50
+    show_full_result_count = False
+
     def get_queryset(self, request):
         """Optimize queryset with select_related."""
         return super().get_queryset(request).select_related("file", "created_by")
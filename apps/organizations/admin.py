@@ -3,6 +3,7 @@ Django admin configuration for organizations app.
 """
 
 from django.contrib import admin
+from django.db.models import Count, Q
 from django.utils.html import format_html
 
 from .models import Organization, OrganizationMembership, Team, TeamMembership
@@ -12,7 +13,7 @@ from .models import Organization, OrganizationMembership, Team, TeamMembership
 class OrganizationAdmin(admin.ModelAdmin):
     """Admin interface for Organization model."""
 
-    list_display = [
+    list_display = (
         "name",
         "slug",
         "subscription_plan",
@@ -21,10 +22,11 @@ class OrganizationAdmin(admin.ModelAdmin):
         "team_count",
         "created_by",
         "created_at",
-    ]
-    list_filter = ["subscription_plan", "subscription_status", "created_at"]
-    search_fields = ["name", "slug", "domain"]
-    readonly_fields = ["id", "created_at", "updated_at", "member_count", "team_count"]
+    )
+    list_filter = ("subscription_plan", "subscription_status")
+    date_hierarchy = "created_at"
+    search_fields = ("name", "slug", "domain")
+    readonly_fields = ("id", "created_at", "updated_at", "member_count", "team_count")
     prepopulated_fields = {"slug": ("name",)}
 
     fieldsets = (
@@ -61,24 +63,48 @@ class OrganizationAdmin(admin.ModelAdmin):
         ),
     )
 
+    # Changelist tuning: declarative joins, smaller pages, and no
+    # unfiltered COUNT(*) alongside the filtered one
+    list_per_page = 50
+    show_full_result_count = False
+
+    def get_queryset(self, request):
+        """Count members/teams in the changelist query, not per row."""
+        return (
+            super()
+            .get_queryset(request)
+            .annotate(
+                _member_count=Count(
+                    "memberships",
+                    filter=Q(memberships__status="active"),
+                    distinct=True,
+                ),
+                _team_count=Count("teams", distinct=True),
+            )
+        )
+
     def member_count(self, obj):
         """Display member count."""
-        return obj.member_count
+        count = getattr(obj, "_member_count", None)
+        return count if count is not None else obj.member_count
 
     member_count.short_description = "Members"
+    member_count.admin_order_field = "_member_count"
 
     def team_count(self, obj):
         """Display team count."""
-        return obj.team_count
+        count = getattr(obj, "_team_count", None)
+        return count if count is not None else obj.team_count
 
     team_count.short_description = "Teams"
+    team_count.admin_order_field = "_team_count"
 
 
 @admin.register(Team)
 class TeamAdmin(admin.ModelAdmin):
     """Admin interface for Team model."""
 
-    list_display = [
+    list_display = (
         "name",
         "organization",
         "slug",
@@ -87,10 +113,11 @@ class TeamAdmin(admin.ModelAdmin):
         "is_archived",
         "created_by",
         "created_at",
-    ]
-    list_filter = ["organization", "is_default", "is_archived", "created_at"]
-    search_fields = ["name", "slug", "description", "organization__name"]
-    readonly_fields = ["id", "created_at", "updated_at", "member_count"]
+    )
+    list_filter = ("organization", "is_default", "is_archived")
+    date_hierarchy = "created_at"
+    search_fields = ("name", "slug", "description", "organization__name")
+    readonly_fields = ("id", "created_at", "updated_at", "member_count")
 
     fieldsets = (
         (
@@ -114,11 +141,32 @@ class TeamAdmin(admin.ModelAdmin):
         ),
     )
 
+    # Changelist tuning: declarative joins, smaller pages, and no
+    # unfiltered COUNT(*) alongside the filtered one
+    list_per_page = 50
+    show_full_result_count = False
+
+    def get_queryset(self, request):
+        """Count members in the changelist query, not per row."""
+        return (
+            super()
+            .get_queryset(request)
+            .annotate(
+                _member_count=Count(
+                    "memberships",
+                    filter=Q(memberships__status="active"),
+                    distinct=True,
+                )
+            )
+        )
+
     def member_count(self, obj):
         """Display member count."""
-        return obj.member_count
+        count = getattr(obj, "_member_count", None)
+        return count if count is not None else obj.member_count
 
     member_count.short_description = "Members"
+    member_count.admin_order_field = "_member_count"
 
     def color_display(self, obj):
         """Display color as a colored box."""
@@ -134,7 +182,7 @@ class TeamAdmin(admin.ModelAdmin):
 class OrganizationMembershipAdmin(admin.ModelAdmin):
     """Admin interface for OrganizationMembership model."""
 
-    list_display = [
+    list_display = (
         "user",
         "organization",
         "role",
@@ -142,16 +190,17 @@ class OrganizationMembershipAdmin(admin.ModelAdmin):
         "joined_at",
         "last_accessed",
         "invited_by",
-    ]
-    list_filter = ["role", "status", "organization", "joined_at"]
-    search_fields = [
+    )
+    list_filter = ("role", "status", "organization")
+    date_hierarchy = "joined_at"
+    search_fields = (
         "user__username",
         "user__email",
         "user__first_name",
         "user__last_name",
         "organization__name",
-    ]
-    readonly_fields = ["id", "created_at", "last_accessed"]
+    )
+    readonly_fields = ("id", "created_at", "last_accessed")
 
     fieldsets = (
         ("Membership", {"fields": ("organization", "user", "role", "status")}),
@@ -162,6 +211,12 @@ class OrganizationMembershipAdmin(admin.ModelAdmin):
         ),
     )
 
+    # Changelist tuning: declarative joins, smaller pages, and no
+    # unfiltered COUNT(*) alongside the filtered one
+    list_select_related = ("user", "organization", "invited_by")
+    list_per_page = 50
+    show_full_result_count = False
+
     def get_queryset(self, request):
         """Optimize queryset with select_related."""
         return (
@@ -175,17 +230,18 @@ class OrganizationMembershipAdmin(admin.ModelAdmin):
 class TeamMembershipAdmin(admin.ModelAdmin):
     """Admin interface for TeamMembership model."""
 
-    list_display = ["user", "team", "role", "status", "joined_at", "invited_by"]
-    list_filter = ["role", "status", "team__organization", "team", "joined_at"]
-    search_fields = [
+    list_display = ("user", "team", "role", "status", "joined_at", "invited_by")
+    list_filter = ("role", "status", "team__organization", "team")
+    date_hierarchy = "joined_at"
+    search_fields = (
         "user__username",
         "user__email",
         "user__first_name",
         "user__last_name",
         "team__name",
         "team__organization__name",
-    ]
-    readonly_fields = ["id", "created_at"]
+    )
+    readonly_fields = ("id", "created_at")
 
     fieldsets = (
         ("Membership", {"fields": ("team", "user", "role", "status")}),
@@ -193,6 +249,12 @@ class TeamMembershipAdmin(admin.ModelAdmin):
         ("Metadata", {"fields": ("id", "created_at"), "classes": ("collapse",)}),
     )
 
+    # Changelist tuning: declarative joins, smaller pages, and no
+    # unfiltered COUNT(*) alongside the filtered one
+    list_select_related = ("user", "team", "team__organization", "invited_by")
+    list_per_page = 50
+    show_full_result_count = False
+
     def get_queryset(self, request):
         """Optimize queryset with select_related."""
         return (
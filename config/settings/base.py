@@ -197,6 +197,14 @@ CELERY_TASK_SERIALIZER = "json"
 CELERY_RESULT_SERIALIZER = "json"
 CELERY_TIMEZONE = "UTC"
 
+# Periodic tasks
+CELERY_BEAT_SCHEDULE = {
+    "flush-collaboration-activity-buffers": {
+        "task": "collaboration.flush_activity_buffers",
+        "schedule": 5.0,  # seconds
+    },
+}
+
 # Cache Configuration
 CACHES = {
     "default": {
@@ -2,6 +2,7 @@
 Development settings for Smart Collaborative Backend project.
 """
 
+import logging
 from datetime import timedelta
 
 from .base import *  # noqa: F401, F403
@@ -10,6 +11,13 @@ from .base import *  # noqa: F401, F403
 DEBUG = True
 ALLOWED_HOSTS = ["*"]
 
+# N+1 query guard - warns loudly when a lazy load sneaks past the explicit
+# select_related/prefetch_related on hot endpoints
+INSTALLED_APPS += ["nplusone.ext.django"]  # noqa: F405
+MIDDLEWARE = ["nplusone.ext.django.NPlusOneMiddleware"] + MIDDLEWARE  # noqa: F405
+NPLUSONE_LOGGER = logging.getLogger("nplusone")
+NPLUSONE_LOG_LEVEL = logging.WARNING
+
 # CORS settings for development
 CORS_ALLOW_ALL_ORIGINS = True
 CORS_ALLOW_CREDENTIALS = True